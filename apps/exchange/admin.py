@@ -1,8 +1,9 @@
 from django.contrib import admin
 from django.contrib.admin import AdminSite
+from django.db.models import CharField, Value
+from django.db.models.functions import Concat
 from django.urls import path
 from django.shortcuts import render
-from decimal import Decimal
 from datetime import date
 from typing import Any
 
@@ -11,6 +12,8 @@ from apps.exchange.infrastructure.persistence.models import (
     CurrencyExchangeRate,
     Provider,
 )
+from apps.exchange.infrastructure.persistence.repositories import CurrencyRepository
+from apps.exchange.api.v1.serializers import ConverterInputSerializer
 from apps.exchange.domain.services import ExchangeRateService
 
 
@@ -43,11 +46,13 @@ class ExchangeAdminSite(AdminSite):
         ] + super().get_urls()
 
     def converter_view(self, request: Any) -> Any:
+        currencies = CurrencyRepository.get_code_map()
+
         context = {
             **self.each_context(request),
             'title': 'Currency Converter',
             'subtitle': 'Convert amounts between currencies',
-            'currencies': Currency.objects.all().order_by('code'),
+            'currencies': [currencies[code] for code in sorted(currencies)],
             'results': None,
             'form_data': None,
         }
@@ -58,16 +63,6 @@ class ExchangeAdminSite(AdminSite):
             target_codes = request.POST.getlist('target_currencies')
             date_str = request.POST.get('valuation_date')
 
-            try:
-                amount = Decimal(amount_str)
-            except:
-                amount = Decimal('0')
-
-            try:
-                valuation_date = date.fromisoformat(date_str) if date_str else date.today()
-            except:
-                valuation_date = date.today()
-
             context['form_data'] = {
                 'source_currency': source_code,
                 'amount': amount_str,
@@ -75,16 +70,27 @@ class ExchangeAdminSite(AdminSite):
                 'valuation_date': date_str or date.today().isoformat()
             }
 
-            if source_code and target_codes and amount > 0:
-                results = []
-                for target_code in target_codes:
-                    result = ExchangeRateService.convert_amount(
-                        source_code,
-                        target_code,
-                        amount,
-                        valuation_date
-                    )
+            input_serializer = ConverterInputSerializer(data={
+                'source_currency': source_code,
+                'amount': amount_str,
+                'target_currencies': target_codes,
+                'valuation_date': date_str or None,
+            })
+
+            if input_serializer.is_valid():
+                data = input_serializer.validated_data
+                source_code = data['source_currency']
+                target_codes = data['target_currencies']
 
+                results = []
+                conversions = ExchangeRateService.convert_amounts_bulk(
+                    source_code,
+                    target_codes,
+                    data['amount'],
+                    data.get('valuation_date') or date.today()
+                )
+
+                for target_code, result in zip(target_codes, conversions):
                     if result:
                         results.append({
                             'source': result['source_currency'],
@@ -124,9 +130,21 @@ class CurrencyExchangeRateAdmin(admin.ModelAdmin):
     date_hierarchy = 'valuation_date'
     ordering = ('-valuation_date', 'source_currency__code')
 
+    def get_queryset(self, request):
+        # The pair label is built by the database, so rows need no currency objects
+        return super().get_queryset(request).annotate(
+            currency_pair=Concat(
+                'source_currency__code',
+                Value('/'),
+                'exchanged_currency__code',
+                output_field=CharField(),
+            )
+        )
+
     def get_currency_pair(self, obj: CurrencyExchangeRate) -> str:
-        return f"{obj.source_currency.code}/{obj.exchanged_currency.code}"
+        return obj.currency_pair
     get_currency_pair.short_description = 'Currency Pair'  # type: ignore
+    get_currency_pair.admin_order_field = 'currency_pair'  # type: ignore
 
 
 class ProviderAdmin(admin.ModelAdmin):
@@ -3,6 +3,9 @@ Serializers for the exchange bounded context.
 Handles validation and transformation between API and ORM layers.
 """
 
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
 
 from apps.exchange.infrastructure.persistence.models import (
@@ -24,8 +27,8 @@ class CurrencySerializer(serializers.ModelSerializer):
 
 
 class CurrencyExchangeRateSerializer(serializers.ModelSerializer):
-    source_currency = CurrencySerializer(read_only=True)
-    exchanged_currency = CurrencySerializer(read_only=True)
+    source_currency = serializers.SlugRelatedField(slug_field="code", read_only=True)
+    exchanged_currency = serializers.SlugRelatedField(slug_field="code", read_only=True)
 
     class Meta:
         model = CurrencyExchangeRate
@@ -51,19 +54,43 @@ class ProviderSerializer(serializers.ModelSerializer):
         model = Provider
         fields = ["id", "name", "name_display", "priority", "is_active", "created_at", "updated_at"]
         read_only_fields = ["id", "created_at", "updated_at"]
+        # Priority uniqueness is enforced by the database constraint, see save().
+        extra_kwargs = {"priority": {"validators": []}}
 
-    def validate_priority(self, value):
-        instance = self.instance
-        existing = Provider.objects.filter(priority=value)
+    def save(self, **kwargs):
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError:
+            priority = self.validated_data.get("priority")
+            existing = Provider.objects.filter(priority=priority)
 
-        if instance:
-            existing = existing.exclude(pk=instance.pk)
+            if self.instance:
+                existing = existing.exclude(pk=self.instance.pk)
 
-        if existing.exists():
             existing_provider = existing.first()
-            raise serializers.ValidationError(
-                f"Priority {value} is already assigned to {existing_provider.get_name_display()}. "
-                f"Please choose a different priority or update the existing provider first."
-            )
+            if existing_provider is None:
+                raise
+
+            raise serializers.ValidationError({
+                "priority": [
+                    f"Priority {priority} is already assigned to {existing_provider.get_name_display()}. "
+                    f"Please choose a different priority or update the existing provider first."
+                ]
+            })
+
 
-        return value
\ No newline at end of file
+class ConverterInputSerializer(serializers.Serializer):
+    """Validates the admin currency converter form once per submission."""
+
+    source_currency = serializers.CharField()
+    amount = serializers.DecimalField(
+        max_digits=20,
+        decimal_places=8,
+        min_value=Decimal("0.00000001"),
+    )
+    target_currencies = serializers.ListField(
+        child=serializers.CharField(),
+        allow_empty=False,
+    )
+    valuation_date = serializers.DateField(required=False, allow_null=True)
@@ -3,11 +3,13 @@ ViewSets for the exchange API v1.
 Each ViewSet exposes standard CRUD operations via DRF router.
 """
 
+from collections import defaultdict
 from decimal import Decimal
-from datetime import datetime, timedelta
+from datetime import date
 
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
@@ -22,9 +24,21 @@ from apps.exchange.infrastructure.persistence.models import (
     CurrencyExchangeRate,
     Provider,
 )
+from apps.exchange.infrastructure.persistence.repositories import CurrencyRepository
 from apps.exchange.domain.services import ExchangeRateService
 
 
+# Longest date range (in days) served by the time-series endpoint
+TIME_SERIES_MAX_DAYS = 366
+
+
+class RatePagination(LimitOffsetPagination):
+    """Rates are always paginated: a page holds default_limit rows unless ?limit= asks for more, up to max_limit."""
+
+    default_limit = 100
+    max_limit = 1000
+
+
 @extend_schema(tags=['Currencies'])
 class CurrencyViewSet(viewsets.ModelViewSet):
 
@@ -35,11 +49,22 @@ class CurrencyViewSet(viewsets.ModelViewSet):
 @extend_schema(tags=['Rates'])
 class CurrencyExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
 
+    # The serializer renders currencies by code only, so the joined rows are
+    # narrowed to that column.
     queryset = CurrencyExchangeRate.objects.select_related(
         "source_currency",
         "exchanged_currency",
-    ).all()
+    ).only(
+        "id",
+        "valuation_date",
+        "rate_value",
+        "created_at",
+        "updated_at",
+        "source_currency__code",
+        "exchanged_currency__code",
+    )
     serializer_class = CurrencyExchangeRateSerializer
+    pagination_class = RatePagination
 
     @extend_schema(
         parameters=[
@@ -60,7 +85,8 @@ class CurrencyExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
         - date_to: End date YYYY-MM-DD (required)
 
         Returns:
-        List of rates for all target currencies within the date range.
+        Rates within the date range grouped by target currency code, each as a
+        list of {valuation_date, rate_value} points ordered by date.
         If a rate doesn't exist in DB for a specific day, it will be fetched from providers.
         """
         source_currency_code = request.query_params.get('source_currency')
@@ -74,8 +100,8 @@ class CurrencyExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
             )
 
         try:
-            date_from = datetime.strptime(date_from_str, "%Y-%m-%d").date()
-            date_to = datetime.strptime(date_to_str, "%Y-%m-%d").date()
+            date_from = date.fromisoformat(date_from_str)
+            date_to = date.fromisoformat(date_to_str)
         except ValueError:
             return Response(
                 {"error": "Invalid date format. Use YYYY-MM-DD"},
@@ -88,43 +114,44 @@ class CurrencyExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            source_currency = Currency.objects.get(code=source_currency_code.upper())
-        except Currency.DoesNotExist:
+        if (date_to - date_from).days >= TIME_SERIES_MAX_DAYS:
             return Response(
-                {"error": f"Currency {source_currency_code} not found"},
-                status=status.HTTP_404_NOT_FOUND
+                {"error": f"Date range cannot exceed {TIME_SERIES_MAX_DAYS} days"},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
-        all_currencies = Currency.objects.exclude(id=source_currency.id).all()
+        currencies = CurrencyRepository.get_code_map()
+        source_currency = currencies.get(source_currency_code.upper())
 
-        results = []
-        current_date = date_from
+        if source_currency is None:
+            return Response(
+                {"error": f"Currency {source_currency_code} not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
 
-        while current_date <= date_to:
-            for target_currency in all_currencies:
-                rate_value = ExchangeRateService.get_exchange_rate(
-                    source_currency.code,
-                    target_currency.code,
-                    current_date
-                )
+        target_codes = [code for code in sorted(currencies) if code != source_currency.code]
 
-                if rate_value:
-                    results.append({
-                        "source_currency": source_currency.code,
-                        "exchanged_currency": target_currency.code,
-                        "valuation_date": current_date.strftime("%Y-%m-%d"),
-                        "rate_value": str(rate_value)
-                    })
+        series = ExchangeRateService.get_rates_for_range(
+            source_currency.code,
+            target_codes,
+            date_from,
+            date_to
+        )
 
-            current_date += timedelta(days=1)
+        # Columnar payload: one list of points per target currency
+        rates = defaultdict(list)
+        for (target_code, valuation_date), rate_value in sorted(series.items()):
+            rates[target_code].append({
+                "valuation_date": valuation_date.isoformat(),
+                "rate_value": str(rate_value)
+            })
 
         return Response({
-            "source_currency": source_currency_code.upper(),
+            "source_currency": source_currency.code,
             "date_from": date_from_str,
             "date_to": date_to_str,
-            "total_rates": len(results),
-            "rates": results
+            "total_rates": len(series),
+            "rates": rates
         })
 
     @extend_schema(
@@ -154,6 +181,16 @@ class CurrencyExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
+        missing_codes = CurrencyRepository.get_missing_codes(
+            [source_currency_code, exchanged_currency_code]
+        )
+
+        if missing_codes:
+            return Response(
+                {"error": f"Currency not found: {', '.join(sorted(missing_codes))}"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
         try:
             amount = Decimal(amount_str)
         except (ValueError, TypeError, Exception):
@@ -172,7 +209,7 @@ class CurrencyExchangeRateViewSet(viewsets.ReadOnlyModelViewSet):
         valuation_date = None
         if valuation_date_str:
             try:
-                valuation_date = datetime.strptime(valuation_date_str, "%Y-%m-%d").date()
+                valuation_date = date.fromisoformat(valuation_date_str)
             except ValueError:
                 return Response(
                     {"error": "Invalid date format. Use YYYY-MM-DD"},
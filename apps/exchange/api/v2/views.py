@@ -1,23 +1,32 @@
 from decimal import Decimal
 from datetime import datetime
+from functools import lru_cache
 
+from django.core.cache import cache
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from drf_spectacular.utils import extend_schema, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 
+from apps.exchange.domain.services import ONE, convert_scaled
 from apps.exchange.infrastructure.persistence.models import ProviderName
 from apps.exchange.infrastructure.providers.registry import PROVIDER_REGISTRY
 from core.settings import EXCHANGERATE_API_KEY, EXCHANGERATE_URL
 
 
+# How long (seconds) a rate fetched from the provider is reused
+RATE_CACHE_TIMEOUT = 3600
+
+
+@lru_cache(maxsize=1)
 def get_exchange_rate_provider():
     """
     Returns the ExchangeRateProvider instance or None if not available.
 
     Checks both that the enum entry exists in the registry and that the
-    required environment variables are configured.
+    required environment variables are configured. Both are fixed at import
+    time and the provider is stateless, so the result is computed once.
     """
     if ProviderName.EXCHANGE_RATE not in PROVIDER_REGISTRY:
         return None, "Provider 'exchange_rate' is not registered in PROVIDER_REGISTRY"
@@ -41,10 +50,6 @@ class ExchangeRateV2ViewSet(viewsets.ViewSet):
     )
     @action(detail=False, methods=['get'], url_path='convert')
     def convert(self, request):
-        provider, error = get_exchange_rate_provider()
-        if error or provider is None:
-            return Response({"error": error}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-
         source_currency_code = request.query_params.get('source_currency')
         exchanged_currency_code = request.query_params.get('exchanged_currency')
         amount_str = request.query_params.get('amount')
@@ -69,11 +74,29 @@ class ExchangeRateV2ViewSet(viewsets.ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        rate_value = provider.get_exchange_rate_data(
-            source_currency_code.upper(),
-            exchanged_currency_code.upper(),
-            datetime.today().date()
-        )
+        today = datetime.today().date()
+
+        # Identity conversion: no provider call needed
+        if source_currency_code.upper() == exchanged_currency_code.upper():
+            rate_value = ONE
+        else:
+            provider, error = get_exchange_rate_provider()
+            if error or provider is None:
+                return Response({"error": error}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+            cache_key = f"exchange:v2_rate:{source_currency_code.upper()}:{exchanged_currency_code.upper()}:{today.isoformat()}"
+            rate_value = cache.get(cache_key)
+
+            if rate_value is None:
+                rate_value = provider.get_exchange_rate_data(
+                    source_currency_code.upper(),
+                    exchanged_currency_code.upper(),
+                    today
+                )
+
+                # Failures are not cached so the next request retries the provider
+                if rate_value is not None:
+                    cache.set(cache_key, rate_value, RATE_CACHE_TIMEOUT)
 
         if rate_value is None:
             return Response(
@@ -81,7 +104,7 @@ class ExchangeRateV2ViewSet(viewsets.ViewSet):
                 status=status.HTTP_502_BAD_GATEWAY
             )
 
-        converted_amount = (amount * rate_value).quantize(Decimal("0.000001"))
+        converted_amount = convert_scaled(amount, rate_value)
 
         return Response({
             "provider": "exchange_rate",
@@ -90,5 +113,5 @@ class ExchangeRateV2ViewSet(viewsets.ViewSet):
             "amount": str(amount),
             "rate": str(rate_value),
             "converted_amount": str(converted_amount),
-            "valuation_date": datetime.today().strftime("%Y-%m-%d")
+            "valuation_date": today.isoformat()
         })
@@ -0,0 +1,62 @@
+"""
+Adaptive admission control for concurrent provider requests.
+"""
+
+import asyncio
+from collections import deque
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Caps requests in flight with an AIMD (additive-increase /
+    multiplicative-decrease) limit.
+
+    The limit grows by INCREASE_STEP after each successful request while the
+    mean latency of the recent window stays within target_latency, and is
+    multiplied by DECREASE_FACTOR after each failure. It always stays within
+    [min_limit, max_limit], so the loader settles near what the provider can
+    actually absorb instead of relying on a fixed cap.
+
+    Usage:
+        async with limiter:
+            started = loop.time()
+            ...
+        await limiter.record(loop.time() - started, success)
+    """
+
+    INCREASE_STEP = 0.5
+    DECREASE_FACTOR = 0.5
+    LATENCY_WINDOW = 20
+
+    def __init__(self, min_limit: int, max_limit: int, target_latency: float):
+        self.min_limit = min_limit
+        self.max_limit = max(min_limit, max_limit)
+        self.target_latency = target_latency
+        self.limit = float(self.min_limit)
+        self.in_flight = 0
+        self._latencies: deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    async def record(self, latency: float, success: bool) -> None:
+        """Adjust the limit from the outcome of one completed request."""
+        async with self._condition:
+            self._latencies.append(latency)
+            mean_latency = sum(self._latencies) / len(self._latencies)
+
+            if not success:
+                self.limit = max(self.min_limit, self.limit * self.DECREASE_FACTOR)
+            elif mean_latency <= self.target_latency:
+                self.limit = min(self.max_limit, self.limit + self.INCREASE_STEP)
+
+            self._condition.notify_all()
@@ -5,7 +5,7 @@ Data Transfer Objects for the application layer.
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
@@ -25,6 +25,14 @@ class ExchangeRateDTO:
     id: Optional[str] = None
 
 
+@dataclass
+class ConversionRequestDTO:
+    source_currency: str
+    exchanged_currency: str
+    amount: Decimal
+    valuation_date: Optional[date] = None
+
+
 @dataclass
 class ConversionResultDTO:
     source_currency: str
@@ -33,3 +41,43 @@ class ConversionResultDTO:
     rate: Decimal
     converted_amount: Decimal
     valuation_date: date
+
+
+@dataclass
+class TimeSeriesRequestDTO:
+    source_currency: str
+    date_from: date
+    date_to: date
+
+
+@dataclass
+class TimeSeriesDataPoint:
+    date: date
+    exchanged_currency: str
+    rate: Decimal
+
+
+@dataclass
+class TimeSeriesResultDTO:
+    source_currency: str
+    date_from: date
+    date_to: date
+    data_points: List[TimeSeriesDataPoint]
+
+
+@dataclass
+class ProviderDTO:
+    name: str
+    priority: int
+    is_active: bool
+    display_name: str
+    id: Optional[str] = None
+
+
+@dataclass
+class RateSyncResultDTO:
+    success: bool
+    rates_synced: int
+    currencies_processed: List[str]
+    errors: List[str]
+    provider_used: Optional[str] = None
@@ -3,20 +3,42 @@ Celery tasks for background processing.
 """
 
 import asyncio
+import contextlib
+import logging
+import uuid
 from datetime import date, timedelta
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
+from itertools import islice, repeat
 from typing import List, Dict, Optional, Tuple, cast
 
-from celery import shared_task
+from celery import chord, shared_task
+from celery.result import AsyncResult
+from django.db import transaction
 
-from apps.exchange.infrastructure.persistence.repositories import CurrencyRepository
-from apps.exchange.infrastructure.persistence.models import (
-    Currency,
-    CurrencyExchangeRate,
-    Provider,
+from apps.exchange.application.concurrency import AdaptiveConcurrencyLimiter
+from apps.exchange.infrastructure.persistence.repositories import (
+    CurrencyExchangeRateRepository,
+    CurrencyRepository,
+    ProviderRepository,
 )
+from apps.exchange.infrastructure.persistence.models import CurrencyExchangeRate
 from apps.exchange.infrastructure.providers.registry import PROVIDER_REGISTRY
 from apps.exchange.domain.interfaces import BaseExchangeRateProvider
+from apps.exchange.domain.services import daterange
+from core.settings import (
+    HISTORICAL_LOAD_CHUNK_DAYS,
+    HISTORICAL_LOAD_MAX_CONCURRENCY,
+    HISTORICAL_LOAD_MIN_CONCURRENCY,
+    HISTORICAL_LOAD_PROCESS_WORKERS,
+    HISTORICAL_LOAD_TARGET_LATENCY,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Precision of stored rates (CurrencyExchangeRate.rate_value decimal places)
+RATE_QUANTUM = Decimal("0.000001")
 
 
 def get_top_priority_provider() -> Optional[BaseExchangeRateProvider]:
@@ -24,71 +46,177 @@ def get_top_priority_provider() -> Optional[BaseExchangeRateProvider]:
     Returns an instance of the active provider with the highest priority (lowest number).
     Returns None if no active provider is found or registered.
     """
-    provider_model = Provider.objects.filter(is_active=True).order_by('priority').first()
+    # Cached, ordered active provider names; refreshed on Provider changes
+    active_provider_names = ProviderRepository.get_active_names()
 
-    if provider_model is None:
+    if not active_provider_names:
         return None
 
-    provider_class = PROVIDER_REGISTRY.get(provider_model.name)
+    provider_class = PROVIDER_REGISTRY.get(active_provider_names[0])
     if provider_class is None:
         return None
 
     return provider_class()
 
 
-async def fetch_rate_async(
+async def fetch_rates_async(
     provider: BaseExchangeRateProvider,
     source_code: str,
-    target_code: str,
-    valuation_date: date
-) -> Optional[Tuple[str, str, date, Decimal]]:
+    target_codes: List[str],
+    valuation_date: date,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
+) -> List[Tuple[str, str, date, Decimal]]:
     """
-    Fetch exchange rate asynchronously by running the synchronous provider
-    in a thread pool via asyncio.to_thread.
+    Fetch the rates from one source currency to several targets with a
+    single bulk call to the provider's async API.
 
-    Returns tuple: (source_code, target_code, date, rate) or None if failed.
+    When a limiter is given, the request waits for a free slot first and
+    reports its latency and outcome back to it; a request that raises is
+    reported as a failure before the exception propagates.
+
+    Returns tuples: (source_code, target_code, date, rate); targets the
+    provider had no rate for are left out.
     """
-    rate = await asyncio.to_thread(
-        provider.get_exchange_rate_data,
-        source_code,
-        target_code,
-        valuation_date
-    )
+    loop = asyncio.get_running_loop()
 
-    if rate is None:
-        print(f"No rate for {source_code}/{target_code} on {valuation_date}")
-        return None
+    async with limiter or contextlib.nullcontext():
+        started = loop.time()
+        try:
+            rates = await provider.get_exchange_rates_bulk_async(
+                source_code,
+                target_codes,
+                valuation_date
+            )
+        except Exception:
+            if limiter is not None:
+                await limiter.record(loop.time() - started, False)
+            raise
+
+    if limiter is not None:
+        await limiter.record(loop.time() - started, bool(rates))
+
+    if len(rates) < len(target_codes):
+        logger.debug(
+            "No rate for %s/%s on %s",
+            source_code, ",".join(code for code in target_codes if code not in rates), valuation_date
+        )
+
+    return [
+        (source_code, target_code, valuation_date, rate)
+        for target_code, rate in rates.items()
+    ]
+
+
+def build_rate_requests(currency_codes: List[str]) -> List[Tuple[str, List[str]]]:
+    """
+    Group the unordered pairs of distinct currency codes by source currency.
 
-    return (source_code, target_code, valuation_date, rate)
+    Each code is paired with the codes after it, so only one direction of
+    each pair is fetched; the inverse rate is derived as 1 / rate.
+    """
+    return [
+        (source_code, currency_codes[i+1:])
+        for i, source_code in enumerate(currency_codes[:-1])
+    ]
 
 
 async def fetch_rates_for_date(
     provider: BaseExchangeRateProvider,
-    currencies: List[Currency],
-    valuation_date: date
+    rate_requests: List[Tuple[str, List[str]]],
+    valuation_date: date,
+    limiter: Optional[AdaptiveConcurrencyLimiter] = None
 ) -> List[Tuple[str, str, date, Decimal]]:
     """
-    Fetch all currency pair rates for a specific date using concurrent requests.
+    Fetch the rates of the given rate requests for a specific date using concurrent requests.
 
     Uses asyncio to make I/O-bound operations concurrent, maximizing throughput.
     """
-    tasks = []
-
-    for i, source_currency in enumerate(currencies):
-        for exchanged_currency in currencies[i+1:]:
-            for src, tgt in [(source_currency, exchanged_currency), (exchanged_currency, source_currency)]:
-                tasks.append(fetch_rate_async(provider, src.code, tgt.code, valuation_date))
+    tasks = [
+        fetch_rates_async(provider, source_code, target_codes, valuation_date, limiter)
+        for source_code, target_codes in rate_requests
+    ]
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
     valid_results: List[Tuple[str, str, date, Decimal]] = []
     for r in results:
-        if r is not None and not isinstance(r, Exception):
-            valid_results.append(cast(Tuple[str, str, date, Decimal], r))
+        if not isinstance(r, Exception):
+            valid_results.extend(cast(List[Tuple[str, str, date, Decimal]], r))
 
     return valid_results
 
 
+async def fetch_rates_for_range(
+    provider: BaseExchangeRateProvider,
+    currency_codes: List[str],
+    date_from: date,
+    date_to: date
+) -> Dict[date, List[Tuple[str, str, date, Decimal]] | BaseException]:
+    """
+    Fetch all currency pair rates for every date in a range within one event loop.
+
+    Each date takes one bulk request per source currency, not one per pair.
+
+    Dates are fetched concurrently rather than one after another. Requests in
+    flight are capped by an AIMD limiter that adapts between
+    HISTORICAL_LOAD_MIN_CONCURRENCY and HISTORICAL_LOAD_MAX_CONCURRENCY.
+    Results are bucketed by date; a date whose fetch raised maps to the
+    exception.
+    """
+    dates = list(daterange(date_from, date_to))
+    rate_requests = build_rate_requests(currency_codes)
+    limiter = AdaptiveConcurrencyLimiter(
+        HISTORICAL_LOAD_MIN_CONCURRENCY,
+        HISTORICAL_LOAD_MAX_CONCURRENCY,
+        HISTORICAL_LOAD_TARGET_LATENCY
+    )
+
+    # The provider shares one HTTP session across all requests
+    async with provider:
+        results = await asyncio.gather(
+            *(fetch_rates_for_date(provider, rate_requests, valuation_date, limiter) for valuation_date in dates),
+            return_exceptions=True
+        )
+
+    return dict(zip(dates, results))
+
+
+def build_rate_rows(
+    results: List[Tuple[str, str, date, Decimal]],
+    code_to_id: Dict[str, uuid.UUID]
+) -> List[Dict]:
+    """
+    Build CurrencyExchangeRate field dicts from fetched rates, adding the
+    derived inverse of each rate.
+
+    Kept free of ORM access so it can run in a worker process.
+    """
+    rows = []
+
+    for source_code, target_code, val_date, rate_value in results:
+        directed_rates = [(source_code, target_code, rate_value)]
+
+        # Only one direction was fetched; derive the inverse
+        if rate_value:
+            directed_rates.append(
+                (target_code, source_code, (Decimal(1) / rate_value).quantize(RATE_QUANTUM))
+            )
+
+        for src_code, tgt_code, value in directed_rates:
+            source_currency_id = code_to_id.get(src_code)
+            target_currency_id = code_to_id.get(tgt_code)
+
+            if source_currency_id and target_currency_id:
+                rows.append({
+                    "source_currency_id": source_currency_id,
+                    "exchanged_currency_id": target_currency_id,
+                    "valuation_date": val_date,
+                    "rate_value": value
+                })
+
+    return rows
+
+
 @shared_task(name="load_historical_data")
 def load_historical_data(date_from_str: str, date_to_str: str) -> Dict:
     """
@@ -112,8 +240,8 @@ def load_historical_data(date_from_str: str, date_to_str: str) -> Dict:
             "rates_loaded": 0
         }
 
-    print(f"Using provider: {provider.__class__.__name__}")
-    print(f"Loading historical data from {date_from_str} to {date_to_str}...")
+    logger.info("Using provider: %s", provider.__class__.__name__)
+    logger.info("Loading historical data from %s to %s...", date_from_str, date_to_str)
 
     try:
         date_from = date.fromisoformat(date_from_str)
@@ -132,66 +260,72 @@ def load_historical_data(date_from_str: str, date_to_str: str) -> Dict:
             "rates_loaded": 0
         }
 
-    currencies = CurrencyRepository.get_all_active()
-    if not currencies:
+    # Only ids and codes are needed: no Currency instances are built
+    code_to_id = {code: currency_id for currency_id, code in CurrencyRepository.get_all_ids_and_codes()}
+    if not code_to_id:
         return {
             "success": False,
             "message": "No currencies found in database",
             "rates_loaded": 0
         }
 
-    print(f"Processing {len(currencies)} currencies for {(date_to - date_from).days + 1} days...")
+    logger.info("Processing %d currencies for %d days...", len(code_to_id), (date_to - date_from).days + 1)
 
-    total_rates_loaded = 0
+    # One event loop for the whole range instead of one per date
+    results_by_date = asyncio.run(fetch_rates_for_range(provider, list(code_to_id), date_from, date_to))
+
+    # Rates already stored for the range, fetched once; the unique
+    # constraint still guards against concurrent inserts
+    existing_rates = set(
+        CurrencyExchangeRate.objects.filter(
+            valuation_date__range=(date_from, date_to)
+        ).values_list("source_currency_id", "exchanged_currency_id", "valuation_date")
+    )
+
+    fetched_results = []
     errors = []
-    current_date = date_from
 
-    while current_date <= date_to:
-        print(f"Processing {current_date}...")
+    for current_date, results in results_by_date.items():
+        logger.debug("Processing %s...", current_date)
+
+        if isinstance(results, BaseException):
+            errors.append(f"Error processing {current_date}: {str(results)}")
+            logger.warning("Error on %s: %s", current_date, results)
+            continue
+
+        if not results:
+            errors.append(f"No rates fetched for {current_date}")
+            continue
 
+        fetched_results.append(results)
+
+    # Row building is pure Python CPU work; with many currencies it can be
+    # spread over worker processes
+    if HISTORICAL_LOAD_PROCESS_WORKERS > 0 and len(fetched_results) > 1:
+        with ProcessPoolExecutor(max_workers=HISTORICAL_LOAD_PROCESS_WORKERS) as pool:
+            row_batches = list(pool.map(build_rate_rows, fetched_results, repeat(code_to_id)))
+    else:
+        row_batches = [build_rate_rows(results, code_to_id) for results in fetched_results]
+
+    rates_to_create = [
+        row
+        for rows in row_batches
+        for row in rows
+        if (row["source_currency_id"], row["exchanged_currency_id"], row["valuation_date"]) not in existing_rates
+    ]
+
+    # Single flush for the whole range
+    total_rates_loaded = 0
+
+    if rates_to_create:
         try:
-            results = asyncio.run(fetch_rates_for_date(provider, currencies, current_date))
-
-            if not results:
-                errors.append(f"No rates fetched for {current_date}")
-                current_date += timedelta(days=1)
-                continue
-
-            rates_to_create = []
-            for source_code, target_code, val_date, rate_value in results:
-                source_currency = next((c for c in currencies if c.code == source_code), None)
-                target_currency = next((c for c in currencies if c.code == target_code), None)
-
-                if source_currency and target_currency:
-                    existing = CurrencyExchangeRate.objects.filter(
-                        source_currency=source_currency,
-                        exchanged_currency=target_currency,
-                        valuation_date=val_date
-                    ).first()
-
-                    if not existing:
-                        rates_to_create.append(
-                            CurrencyExchangeRate(
-                                source_currency=source_currency,
-                                exchanged_currency=target_currency,
-                                valuation_date=val_date,
-                                rate_value=rate_value
-                            )
-                        )
-
-            if rates_to_create:
-                CurrencyExchangeRate.objects.bulk_create(
-                    rates_to_create,
-                    ignore_conflicts=True
-                )
-                total_rates_loaded += len(rates_to_create)
-                print(f"Created {len(rates_to_create)} rates for {current_date}")
+            with transaction.atomic():
+                total_rates_loaded = CurrencyExchangeRateRepository.bulk_insert_rows(rates_to_create)
+            logger.info("Created %d rates", total_rates_loaded)
 
         except Exception as e:
-            errors.append(f"Error processing {current_date}: {str(e)}")
-            print(f"Error on {current_date}: {e}")
-
-        current_date += timedelta(days=1)
+            errors.append(f"Error saving rates: {str(e)}")
+            logger.exception("Error saving rates: %s", e)
 
     return {
         "success": True,
@@ -200,3 +334,52 @@ def load_historical_data(date_from_str: str, date_to_str: str) -> Dict:
         "date_to": date_to_str,
         "errors": errors
     }
+
+
+def split_date_range(date_from: date, date_to: date, chunk_days: int) -> List[Tuple[date, date]]:
+    """
+    Split an inclusive date range into consecutive chunks of at most chunk_days days.
+    """
+    return [
+        (chunk_from, min(chunk_from + timedelta(days=chunk_days - 1), date_to))
+        for chunk_from in islice(daterange(date_from, date_to), 0, None, chunk_days)
+    ]
+
+
+@shared_task(name="aggregate_historical_results")
+def aggregate_historical_results(results: List[Dict], date_from_str: str, date_to_str: str) -> Dict:
+    """
+    Merge the results of the load_historical_data subtasks of one range.
+    """
+    errors = []
+    for result in results:
+        if not result["success"]:
+            errors.append(result.get("message", "Unknown error"))
+        errors.extend(result.get("errors", []))
+
+    return {
+        "success": all(result["success"] for result in results),
+        "rates_loaded": sum(result["rates_loaded"] for result in results),
+        "date_from": date_from_str,
+        "date_to": date_to_str,
+        "errors": errors
+    }
+
+
+def dispatch_historical_load(date_from: date, date_to: date) -> AsyncResult:
+    """
+    Load a date range as a chord of load_historical_data subtasks.
+
+    The range is split into chunks of HISTORICAL_LOAD_CHUNK_DAYS days so
+    several workers can load it in parallel, while each chunk keeps its
+    concurrent fetching and single bulk insert. The returned result is the
+    aggregate_historical_results callback.
+    """
+    subtasks = [
+        load_historical_data.s(chunk_from.isoformat(), chunk_to.isoformat())
+        for chunk_from, chunk_to in split_date_range(date_from, date_to, HISTORICAL_LOAD_CHUNK_DAYS)
+    ]
+
+    return chord(subtasks)(
+        aggregate_historical_results.s(date_from.isoformat(), date_to.isoformat())
+    )
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ExchangeConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.exchange"
+
+    def ready(self):
+        from apps.exchange.infrastructure.persistence import signals  # noqa: F401
@@ -1,9 +1,87 @@
+import asyncio
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from datetime import date
+from datetime import date, timedelta
 
 
 class BaseExchangeRateProvider(ABC):
     @abstractmethod
     def get_exchange_rate_data(self, source_currency: str, exchanged_currency: str, date: date) -> Decimal | None:
         pass
+
+    async def get_exchange_rate_data_async(self, source_currency: str, exchanged_currency: str, date: date) -> Decimal | None:
+        """
+        Async variant of get_exchange_rate_data.
+
+        Runs the synchronous implementation in a worker thread; providers that
+        do network I/O override it with a native async client.
+        """
+        return await asyncio.to_thread(self.get_exchange_rate_data, source_currency, exchanged_currency, date)
+
+    def get_exchange_rates_bulk(self, source_currency: str, exchanged_currencies: list[str], date: date) -> dict[str, Decimal]:
+        """
+        Rates from one source currency to several targets for a date, keyed by
+        target code. Targets without a rate are left out.
+
+        Makes one call per target; providers whose API returns several
+        symbols per request override it.
+        """
+        rates = {}
+
+        for exchanged_currency in exchanged_currencies:
+            rate = self.get_exchange_rate_data(source_currency, exchanged_currency, date)
+            if rate is not None:
+                rates[exchanged_currency] = rate
+
+        return rates
+
+    def get_exchange_rates_timeseries(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date_from: date,
+        date_to: date
+    ) -> dict[date, dict[str, Decimal]]:
+        """
+        Rates from one source currency to several targets for every day of a
+        range, keyed by date and then by target code. Days and targets without
+        a rate are left out.
+
+        Makes one get_exchange_rates_bulk call per day; providers with a
+        time-series endpoint override it.
+        """
+        series = {}
+        current_date = date_from
+
+        while current_date <= date_to:
+            rates = self.get_exchange_rates_bulk(source_currency, exchanged_currencies, current_date)
+            if rates:
+                series[current_date] = rates
+            current_date += timedelta(days=1)
+
+        return series
+
+    async def get_exchange_rates_bulk_async(self, source_currency: str, exchanged_currencies: list[str], date: date) -> dict[str, Decimal]:
+        """
+        Async variant of get_exchange_rates_bulk.
+
+        Fetches every target concurrently through get_exchange_rate_data_async.
+        """
+        rates = await asyncio.gather(*(
+            self.get_exchange_rate_data_async(source_currency, exchanged_currency, date)
+            for exchanged_currency in exchanged_currencies
+        ))
+
+        return {
+            exchanged_currency: rate
+            for exchanged_currency, rate in zip(exchanged_currencies, rates)
+            if rate is not None
+        }
+
+    async def __aenter__(self):
+        """Open resources shared by async calls (e.g. an HTTP session)."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Release resources opened by __aenter__."""
+        return None
@@ -4,10 +4,72 @@ Implements the fallback chain pattern for exchange rate providers.
 """
 
 from decimal import Decimal
-from datetime import date
+from datetime import date, timedelta
+from typing import Iterable, Iterator
 
-from apps.exchange.infrastructure.persistence.models import Currency, CurrencyExchangeRate
+from django.db.models import Q
+
+from apps.exchange.domain.interfaces import BaseExchangeRateProvider
+from apps.exchange.infrastructure.persistence.models import CurrencyExchangeRate
+from apps.exchange.infrastructure.persistence.repositories import (
+    CurrencyExchangeRateRepository,
+    CurrencyRepository,
+)
 from apps.exchange.infrastructure.providers.registry import get_active_providers_ordered
+from core.settings import BULK_CREATE_BATCH_SIZE
+
+
+# Precision of converted amounts
+QUANTUM = Decimal("0.000001")
+
+# Rate of an identity conversion, and numerator of inverted rates
+ONE = Decimal("1")
+
+# Largest stored reverse rate that is inverted: the inverse of a larger one
+# keeps fewer than 4 significant digits at QUANTUM precision
+MAX_INVERTIBLE_RATE = Decimal("1000")
+
+
+def convert_scaled(amount: Decimal, rate: Decimal) -> Decimal:
+    """
+    Compute (amount * rate).quantize(QUANTUM) with integer arithmetic.
+
+    When both operands have at most 6 fractional digits they are scaled to
+    integers, multiplied natively and rounded half-even back to 6 places, which
+    gives exactly the Decimal result. Other inputs use the Decimal path.
+    """
+    amount_exponent = amount.as_tuple().exponent
+    rate_exponent = rate.as_tuple().exponent
+
+    if not (isinstance(amount_exponent, int) and isinstance(rate_exponent, int)) or min(amount_exponent, rate_exponent) < -6:
+        return (amount * rate).quantize(QUANTUM)
+
+    scale = 1_000_000
+    product = int(amount.scaleb(6)) * int(rate.scaleb(6))
+    quotient, remainder = divmod(product, scale)
+
+    if remainder * 2 > scale or (remainder * 2 == scale and quotient % 2):
+        quotient += 1
+
+    return Decimal(quotient).scaleb(-6)
+
+
+def daterange(date_from: date, date_to: date) -> Iterator[date]:
+    """Yield every date from date_from to date_to, both included."""
+    return (date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1))
+
+
+def date_runs(dates: Iterable[date]) -> list[tuple[date, date]]:
+    """Group dates into runs of consecutive days, as ordered (first, last) pairs."""
+    runs = []
+
+    for current_date in sorted(set(dates)):
+        if runs and current_date == runs[-1][1] + timedelta(days=1):
+            runs[-1] = (runs[-1][0], current_date)
+        else:
+            runs.append((current_date, current_date))
+
+    return runs
 
 
 class ExchangeRateService:
@@ -29,28 +91,99 @@ class ExchangeRateService:
 
         Returns exchange rate as Decimal, or None if all providers fail.
         """
-        try:
-            source_currency = Currency.objects.get(code=source_currency_code)
-            exchanged_currency = Currency.objects.get(code=exchanged_currency_code)
+        # Currency codes are ISO 4217: anything else cannot match a currency
+        if len(source_currency_code) != 3 or len(exchanged_currency_code) != 3:
+            return None
 
-            existing_rate = CurrencyExchangeRate.objects.filter(
-                source_currency=source_currency,
-                exchanged_currency=exchanged_currency,
-                valuation_date=valuation_date
-            ).first()
+        source_currency_code = source_currency_code.upper()
+        exchanged_currency_code = exchanged_currency_code.upper()
 
-            if existing_rate:
-                return existing_rate.rate_value
+        currencies = CurrencyRepository.get_by_codes([source_currency_code, exchanged_currency_code])
+        source_currency = currencies.get(source_currency_code)
+        exchanged_currency = currencies.get(exchanged_currency_code)
 
-        except Currency.DoesNotExist:
+        if source_currency is None or exchanged_currency is None:
             return None
 
-        providers = get_active_providers_ordered()
+        # Identity conversion: no lookup needed
+        if source_currency == exchanged_currency:
+            return ONE
 
-        if not providers:
-            return None
+        existing_rate = ExchangeRateService._lookup_directional(
+            source_currency,
+            exchanged_currency,
+            valuation_date
+        )
+
+        if existing_rate is not None:
+            return existing_rate
+
+        rate_value = ExchangeRateService.fetch_rate_from_providers(
+            source_currency_code,
+            exchanged_currency_code,
+            valuation_date
+        )
+
+        if rate_value is not None:
+            # ON CONFLICT DO NOTHING: a concurrent request may have stored it first
+            CurrencyExchangeRate.objects.bulk_create(
+                [CurrencyExchangeRate(
+                    source_currency=source_currency,
+                    exchanged_currency=exchanged_currency,
+                    valuation_date=valuation_date,
+                    rate_value=rate_value
+                )],
+                ignore_conflicts=True
+            )
+
+        return rate_value
+
+    @staticmethod
+    def _lookup_directional(source_currency, exchanged_currency, valuation_date: date) -> Decimal | None:
+        """
+        Return the stored rate for a pair, reading either direction in one query.
+
+        A stored reverse rate B->A answers A->B as its inverse, unless the
+        inverse would be too imprecise (reverse rate of MAX_INVERTIBLE_RATE or
+        more), in which case the direct rate is left to the providers.
+        """
+        rows = dict(
+            CurrencyExchangeRate.objects.filter(
+                Q(source_currency=source_currency, exchanged_currency=exchanged_currency)
+                | Q(source_currency=exchanged_currency, exchanged_currency=source_currency),
+                valuation_date=valuation_date
+            ).values_list("source_currency_id", "rate_value")
+        )
+
+        if source_currency.pk in rows:
+            return rows[source_currency.pk]
+
+        reverse_rate = rows.get(exchanged_currency.pk)
+        if reverse_rate and reverse_rate < MAX_INVERTIBLE_RATE:
+            return (ONE / reverse_rate).quantize(QUANTUM)
+
+        return None
+
+    @staticmethod
+    def fetch_rate_from_providers(
+        source_currency_code: str,
+        exchanged_currency_code: str,
+        valuation_date: date,
+        providers: list[BaseExchangeRateProvider] | None = None
+    ) -> Decimal | None:
+        """
+        Query active providers in priority order, without touching the database.
 
-        rate_value = None
+        Callers fetching many rates can pass the providers list, resolved once,
+        instead of having it looked up on every call.
+
+        Returns the first rate found, or None if all providers fail.
+        """
+        if source_currency_code == exchanged_currency_code:
+            return ONE
+
+        if providers is None:
+            providers = get_active_providers_ordered()
 
         for provider in providers:
             rate_value = provider.get_exchange_rate_data(
@@ -60,20 +193,93 @@ class ExchangeRateService:
             )
 
             if rate_value is not None:
-                break
+                return rate_value
 
-        if rate_value is not None:
-            try:
-                CurrencyExchangeRate.objects.create(
-                    source_currency=source_currency,
-                    exchanged_currency=exchanged_currency,
-                    valuation_date=valuation_date,
-                    rate_value=rate_value
+        return None
+
+    @staticmethod
+    def get_rates_for_range(
+        source_currency_code: str,
+        exchanged_currency_codes: list[str],
+        date_from: date,
+        date_to: date
+    ) -> dict[tuple[str, date], Decimal]:
+        """
+        Get rates from a source currency to several targets over a date range.
+
+        Stored rates are read with a single query. Missing points are requested
+        from each provider, in priority order, as one time series per run of
+        consecutive missing days, so stored days between gaps are not fetched
+        again. New rates are saved together with one bulk insert.
+
+        Returns a dict keyed by (exchanged currency code, valuation date).
+        Points that no provider could supply are left out, as are unknown
+        codes and the source currency itself.
+        """
+        currencies = CurrencyRepository.get_code_map()
+        source_currency = currencies.get(source_currency_code)
+
+        if source_currency is None:
+            return {}
+
+        exchanged_currency_codes = [
+            code for code in exchanged_currency_codes
+            if code in currencies and code != source_currency_code
+        ]
+
+        rates = {
+            (row["exchanged_currency__code"], row["valuation_date"]): row["rate_value"]
+            for row in CurrencyExchangeRateRepository.get_rates_for_date_range_raw(
+                source_currency,
+                date_from,
+                date_to,
+                exchanged_currencies=[currencies[code] for code in exchanged_currency_codes]
+            )
+        }
+
+        missing = {
+            (exchanged_currency_code, current_date)
+            for current_date in daterange(date_from, date_to)
+            for exchanged_currency_code in exchanged_currency_codes
+            if (exchanged_currency_code, current_date) not in rates
+        }
+        new_rates = []
+
+        # Providers are resolved only when something is missing
+        providers = get_active_providers_ordered() if missing else ()
+
+        for provider in providers:
+            for run_from, run_to in date_runs(current_date for _, current_date in missing):
+                run_codes = {code for code, current_date in missing if run_from <= current_date <= run_to}
+
+                series = provider.get_exchange_rates_timeseries(
+                    source_currency_code,
+                    [code for code in exchanged_currency_codes if code in run_codes],
+                    run_from,
+                    run_to
                 )
-            except Exception:
-                pass
 
-        return rate_value
+                for current_date, day_rates in series.items():
+                    for exchanged_currency_code, rate_value in day_rates.items():
+                        if (exchanged_currency_code, current_date) not in missing:
+                            continue
+
+                        missing.discard((exchanged_currency_code, current_date))
+                        rates[(exchanged_currency_code, current_date)] = rate_value
+                        new_rates.append(CurrencyExchangeRate(
+                            source_currency=source_currency,
+                            exchanged_currency=currencies[exchanged_currency_code],
+                            valuation_date=current_date,
+                            rate_value=rate_value
+                        ))
+
+            if not missing:
+                break
+
+        if new_rates:
+            CurrencyExchangeRate.objects.bulk_create(new_rates, ignore_conflicts=True, batch_size=BULK_CREATE_BATCH_SIZE)
+
+        return rates
 
     @staticmethod
     def convert_amount(
@@ -99,7 +305,7 @@ class ExchangeRateService:
         if rate is None:
             return None
 
-        converted_amount = (amount * rate).quantize(Decimal("0.000001"))
+        converted_amount = convert_scaled(amount, rate)
 
         return {
             "source_currency": source_currency_code,
@@ -109,3 +315,69 @@ class ExchangeRateService:
             "converted_amount": converted_amount,
             "valuation_date": valuation_date
         }
+
+    @staticmethod
+    def convert_amounts_bulk(
+        source_currency_code: str,
+        exchanged_currency_codes: list[str],
+        amount: Decimal,
+        valuation_date: date | None = None
+    ) -> list[dict | None]:
+        """
+        Convert an amount from one currency to several target currencies.
+
+        Stored rates for every target are read with a single query; providers
+        are only queried once per target code missing from the database.
+
+        Returns a list aligned with exchanged_currency_codes, holding the
+        conversion details for each target or None if that conversion fails.
+        """
+        if valuation_date is None:
+            valuation_date = date.today()
+
+        currencies = CurrencyRepository.get_code_map()
+        source_currency = currencies.get(source_currency_code)
+
+        if source_currency is None:
+            return [None] * len(exchanged_currency_codes)
+
+        exchanged_currencies = [
+            currencies[code] for code in exchanged_currency_codes if code in currencies
+        ]
+
+        stored_rates = dict(
+            CurrencyExchangeRate.objects.filter(
+                source_currency=source_currency,
+                exchanged_currency__in=exchanged_currencies,
+                valuation_date=valuation_date
+            ).values_list("exchanged_currency__code", "rate_value")
+        )
+
+        for exchanged_currency_code in dict.fromkeys(exchanged_currency_codes):
+            if exchanged_currency_code not in currencies:
+                stored_rates[exchanged_currency_code] = None
+            elif exchanged_currency_code not in stored_rates:
+                stored_rates[exchanged_currency_code] = ExchangeRateService.get_exchange_rate(
+                    source_currency_code,
+                    exchanged_currency_code,
+                    valuation_date
+                )
+
+        results = []
+        for exchanged_currency_code in exchanged_currency_codes:
+            rate = stored_rates[exchanged_currency_code]
+
+            if rate is None:
+                results.append(None)
+                continue
+
+            results.append({
+                "source_currency": source_currency_code,
+                "exchanged_currency": exchanged_currency_code,
+                "amount": amount,
+                "rate": rate,
+                "converted_amount": convert_scaled(amount, rate),
+                "valuation_date": valuation_date
+            })
+
+        return results
@@ -7,6 +7,39 @@ import uuid
 from django.db import models
 
 
+class CoveringUniqueConstraint(models.UniqueConstraint):
+    """
+    UniqueConstraint whose INCLUDE columns are dropped on backends without
+    covering indexes (SQLite), where Django would otherwise skip the whole
+    constraint and lose the uniqueness.
+    """
+
+    def _without_include(self, schema_editor):
+        if not self.include or schema_editor.connection.features.supports_covering_indexes:
+            return None
+        _, args, kwargs = self.deconstruct()
+        del kwargs["include"]
+        return models.UniqueConstraint(*args, **kwargs)
+
+    def constraint_sql(self, model, schema_editor):
+        fallback = self._without_include(schema_editor)
+        if fallback is not None:
+            return fallback.constraint_sql(model, schema_editor)
+        return super().constraint_sql(model, schema_editor)
+
+    def create_sql(self, model, schema_editor):
+        fallback = self._without_include(schema_editor)
+        if fallback is not None:
+            return fallback.create_sql(model, schema_editor)
+        return super().create_sql(model, schema_editor)
+
+    def remove_sql(self, model, schema_editor):
+        fallback = self._without_include(schema_editor)
+        if fallback is not None:
+            return fallback.remove_sql(model, schema_editor)
+        return super().remove_sql(model, schema_editor)
+
+
 class BaseModel(models.Model):
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -45,18 +78,28 @@ class CurrencyExchangeRate(BaseModel):
     )
     valuation_date = models.DateField(db_index=True)
     rate_value = models.DecimalField(
-        db_index=True,
         decimal_places=6,
         max_digits=18,
     )
 
     class Meta:
         constraints = [
-            models.UniqueConstraint(
+            # also serves point lookups of a single rate from the index alone
+            CoveringUniqueConstraint(
                 fields=["source_currency", "exchanged_currency", "valuation_date"],
+                include=["rate_value"],
                 name="unique_rate_per_day",
             )
         ]
+        indexes = [
+            # time-series lookups: one source currency over a date range,
+            # answered from the index alone
+            models.Index(
+                fields=["source_currency", "valuation_date", "exchanged_currency"],
+                include=["rate_value"],
+                name="rate_source_date_cover_idx",
+            ),
+        ]
         ordering = ["-valuation_date"]
 
     def __str__(self):
@@ -3,10 +3,17 @@ Repository pattern implementation.
 Abstracts database access to decouple domain logic from persistence.
 """
 
-from typing import List, Optional
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import date
 from decimal import Decimal
 
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils import timezone
+
+from core.settings import BULK_CREATE_BATCH_SIZE
+
 from apps.exchange.infrastructure.persistence.models import (
     Currency,
     CurrencyExchangeRate,
@@ -17,18 +24,56 @@ from apps.exchange.infrastructure.persistence.models import (
 class CurrencyRepository:
     """Repository for Currency aggregate."""
 
+    # Currencies are a small, rarely modified table: it is cached whole,
+    # keyed by code, and invalidated by the Currency save/delete signals.
+    CACHE_KEY = "exchange:currencies_by_code"
+    CACHE_TIMEOUT = 3600
+
+    @staticmethod
+    def get_code_map() -> dict[str, Currency]:
+        """Get all currencies keyed by code, served from cache when possible."""
+        currencies = cache.get(CurrencyRepository.CACHE_KEY)
+
+        if currencies is None:
+            currencies = Currency.objects.in_bulk(field_name="code")
+            cache.set(CurrencyRepository.CACHE_KEY, currencies, CurrencyRepository.CACHE_TIMEOUT)
+
+        return currencies
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop the cached currency map."""
+        cache.delete(CurrencyRepository.CACHE_KEY)
+
     @staticmethod
     def get_by_code(code: str) -> Optional[Currency]:
         """Get currency by code."""
-        try:
-            return Currency.objects.get(code=code.upper())
-        except Currency.DoesNotExist:
-            return None
+        return CurrencyRepository.get_code_map().get(code.upper())
+
+    @staticmethod
+    def get_by_codes(codes: Iterable[str]) -> dict[str, Currency]:
+        """Get currencies by code with a single cache read; unknown codes are left out."""
+        currencies = CurrencyRepository.get_code_map()
+        return {
+            code.upper(): currencies[code.upper()]
+            for code in codes
+            if code.upper() in currencies
+        }
+
+    @staticmethod
+    def get_missing_codes(codes: Iterable[str]) -> set[str]:
+        """Get the given codes that do not match any currency."""
+        return {code.upper() for code in codes} - CurrencyRepository.get_code_map().keys()
 
     @staticmethod
     def get_all_active() -> List[Currency]:
-        """Get all currencies."""
-        return list(Currency.objects.all())
+        """Get all currencies ordered by code, served from the cached code map."""
+        return list(CurrencyRepository.get_code_map().values())
+
+    @staticmethod
+    def get_all_ids_and_codes() -> List[Tuple[uuid.UUID, str]]:
+        """Get (id, code) pairs for all currencies, without building model instances."""
+        return list(Currency.objects.values_list('id', 'code'))
 
     @staticmethod
     def create(code: str, name: str, symbol: str) -> Currency:
@@ -55,10 +100,14 @@ class CurrencyRepository:
             )
             for c in currencies
         ]
-        return Currency.objects.bulk_create(
+        created = Currency.objects.bulk_create(
             currency_objects,
-            ignore_conflicts=True
+            ignore_conflicts=True,
+            batch_size=BULK_CREATE_BATCH_SIZE
         )
+        # bulk_create does not send post_save
+        CurrencyRepository.invalidate_cache()
+        return created
 
 
 class CurrencyExchangeRateRepository:
@@ -70,8 +119,11 @@ class CurrencyExchangeRateRepository:
         exchanged_currency: Currency,
         valuation_date: date
     ) -> Optional[CurrencyExchangeRate]:
-        """Get exchange rate for specific date."""
-        return CurrencyExchangeRate.objects.filter(
+        """Get exchange rate for specific date, with both currencies joined in."""
+        return CurrencyExchangeRate.objects.select_related(
+            'source_currency',
+            'exchanged_currency'
+        ).filter(
             source_currency=source_currency,
             exchanged_currency=exchanged_currency,
             valuation_date=valuation_date
@@ -95,6 +147,30 @@ class CurrencyExchangeRateRepository:
             .order_by('valuation_date', 'exchanged_currency__code')
         )
 
+    @staticmethod
+    def get_rates_for_date_range_raw(
+        source_currency: Currency,
+        date_from: date,
+        date_to: date,
+        exchanged_currencies: Optional[Iterable[Currency]] = None
+    ) -> List[dict]:
+        """
+        Get the rates for a currency within date range as plain dicts with
+        valuation_date, exchanged_currency__code and rate_value keys, for
+        read-only callers that do not need model instances. Rows are not
+        ordered.
+        """
+        rates = CurrencyExchangeRate.objects.filter(
+            source_currency=source_currency,
+            valuation_date__range=(date_from, date_to)
+        )
+        if exchanged_currencies is not None:
+            rates = rates.filter(exchanged_currency__in=exchanged_currencies)
+
+        return list(
+            rates.order_by().values('valuation_date', 'exchanged_currency__code', 'rate_value')
+        )
+
     @staticmethod
     def create(
         source_currency: Currency,
@@ -124,13 +200,38 @@ class CurrencyExchangeRateRepository:
         ]
         return CurrencyExchangeRate.objects.bulk_create(
             rate_objects,
-            ignore_conflicts=True
+            ignore_conflicts=True,
+            batch_size=BULK_CREATE_BATCH_SIZE
         )
 
+    @staticmethod
+    def bulk_insert_rows(rows: List[Dict]) -> int:
+        """
+        Insert rates given as field dicts keyed by *_id, skipping rows that
+        already exist. Returns the number of rows inserted.
+
+        bulk_create with ignore_conflicts does not report which rows were
+        skipped, so the count is the growth of the rows stored over the
+        inserted dates; run it in a transaction to keep it exact.
+        """
+        if not rows:
+            return 0
+
+        dates = [row["valuation_date"] for row in rows]
+        stored = CurrencyExchangeRate.objects.filter(valuation_date__range=(min(dates), max(dates)))
+
+        count_before = stored.count()
+        CurrencyExchangeRate.objects.bulk_create(
+            [CurrencyExchangeRate(**row) for row in rows],
+            ignore_conflicts=True,
+            batch_size=BULK_CREATE_BATCH_SIZE
+        )
+
+        return stored.count() - count_before
+
     @staticmethod
     def delete_older_than(days: int) -> int:
         """Delete rates older than specified days."""
-        from django.utils import timezone
         cutoff_date = timezone.now().date() - timezone.timedelta(days=days)
         deleted, _ = CurrencyExchangeRate.objects.filter(
             valuation_date__lt=cutoff_date
@@ -140,15 +241,40 @@ class CurrencyExchangeRateRepository:
     @staticmethod
     def get_latest_rate_date(source_currency: Currency) -> Optional[date]:
         """Get the most recent date with rates for a currency."""
-        latest = CurrencyExchangeRate.objects.filter(
+        return CurrencyExchangeRate.objects.filter(
             source_currency=source_currency
-        ).order_by('-valuation_date').first()
-        return latest.valuation_date if latest else None
+        ).aggregate(latest=Max('valuation_date'))['latest']
 
 
 class ProviderRepository:
     """Repository for Provider aggregate."""
 
+    # Provider configuration changes rarely and is read on every rate lookup;
+    # the cached names are invalidated by the Provider save/delete signals.
+    CACHE_KEY = "exchange:active_provider_names"
+    CACHE_TIMEOUT = 300
+
+    @staticmethod
+    def get_active_names() -> List[str]:
+        """Get names of active providers ordered by priority, served from cache when possible."""
+        names = cache.get(ProviderRepository.CACHE_KEY)
+
+        if names is None:
+            names = list(
+                Provider.objects
+                .filter(is_active=True)
+                .order_by('priority')
+                .values_list('name', flat=True)
+            )
+            cache.set(ProviderRepository.CACHE_KEY, names, ProviderRepository.CACHE_TIMEOUT)
+
+        return names
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop the cached active provider names."""
+        cache.delete(ProviderRepository.CACHE_KEY)
+
     @staticmethod
     def get_active_ordered() -> List[Provider]:
         """Get all active providers ordered by priority."""
@@ -0,0 +1,22 @@
+"""
+Model signal handlers.
+Keep cached lookups in sync with the database.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.exchange.infrastructure.persistence.models import Currency, Provider
+from apps.exchange.infrastructure.persistence.repositories import CurrencyRepository, ProviderRepository
+
+
+@receiver(post_save, sender=Currency)
+@receiver(post_delete, sender=Currency)
+def invalidate_currency_cache(sender, **kwargs):
+    CurrencyRepository.invalidate_cache()
+
+
+@receiver(post_save, sender=Provider)
+@receiver(post_delete, sender=Provider)
+def invalidate_provider_cache(sender, **kwargs):
+    ProviderRepository.invalidate_cache()
@@ -0,0 +1,111 @@
+"""
+Caching of provider rate lookups in the Django cache.
+"""
+
+from decimal import Decimal
+from datetime import date, timedelta
+
+from django.core.cache import cache
+
+
+class CachedRatesMixin:
+    """
+    Serves bulk rate lookups from the Django cache, keyed by provider, pair
+    and date, and only sends the targets missing from it to the provider.
+
+    Providers implement _fetch_rates and _fetch_rates_async with the
+    get_exchange_rates_bulk signature, and _fetch_timeseries with the
+    get_exchange_rates_timeseries one. Rates for past dates never change and
+    are kept for PAST_RATE_TIMEOUT seconds, long enough for repeated lookups
+    while the database keeps them for good; today's rates expire after
+    TODAY_RATE_TIMEOUT seconds.
+    """
+
+    CACHE_PREFIX = "exchange:provider_rate"
+    PAST_RATE_TIMEOUT = 7 * 24 * 3600
+    TODAY_RATE_TIMEOUT = 3600
+
+    def _rate_cache_keys(self, source_currency: str, exchanged_currencies: list[str], valuation_date: date) -> dict[str, str]:
+        prefix = f"{self.CACHE_PREFIX}:{type(self).__name__}:{source_currency}"
+        date_str = valuation_date.isoformat()
+        return {
+            exchanged_currency: f"{prefix}:{exchanged_currency}:{date_str}"
+            for exchanged_currency in exchanged_currencies
+        }
+
+    def _rate_cache_timeout(self, valuation_date: date) -> int:
+        return self.PAST_RATE_TIMEOUT if valuation_date < date.today() else self.TODAY_RATE_TIMEOUT
+
+    def get_exchange_rates_bulk(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date: date
+    ) -> dict[str, Decimal]:
+        keys = self._rate_cache_keys(source_currency, exchanged_currencies, date)
+        cached = cache.get_many(keys.values())
+        rates = {code: Decimal(cached[key]) for code, key in keys.items() if key in cached}
+
+        missing = [code for code in exchanged_currencies if code not in rates]
+        if missing:
+            fetched = self._fetch_rates(source_currency, missing, date)
+            cache.set_many({keys[code]: str(rate) for code, rate in fetched.items()}, self._rate_cache_timeout(date))
+            rates.update(fetched)
+
+        return rates
+
+    def get_exchange_rates_timeseries(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date_from: date,
+        date_to: date
+    ) -> dict[date, dict[str, Decimal]]:
+        days = [date_from + timedelta(days=offset) for offset in range((date_to - date_from).days + 1)]
+        keys = {day: self._rate_cache_keys(source_currency, exchanged_currencies, day) for day in days}
+        cached = cache.get_many([key for day_keys in keys.values() for key in day_keys.values()])
+
+        series = {}
+        for day, day_keys in keys.items():
+            rates = {code: Decimal(cached[key]) for code, key in day_keys.items() if key in cached}
+            if rates:
+                series[day] = rates
+
+        # Targets with a gap anywhere in the range are fetched over the whole range
+        missing = [
+            code for code in exchanged_currencies
+            if any(code not in series.get(day, {}) for day in days)
+        ]
+        if missing:
+            fetched = self._fetch_timeseries(source_currency, missing, date_from, date_to)
+            entries_by_timeout = {}
+
+            for day, rates in fetched.items():
+                day_keys = self._rate_cache_keys(source_currency, list(rates), day)
+                entries_by_timeout.setdefault(self._rate_cache_timeout(day), {}).update(
+                    {day_keys[code]: str(rate) for code, rate in rates.items()}
+                )
+                series.setdefault(day, {}).update(rates)
+
+            for timeout, entries in entries_by_timeout.items():
+                cache.set_many(entries, timeout)
+
+        return series
+
+    async def get_exchange_rates_bulk_async(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date: date
+    ) -> dict[str, Decimal]:
+        keys = self._rate_cache_keys(source_currency, exchanged_currencies, date)
+        cached = await cache.aget_many(keys.values())
+        rates = {code: Decimal(cached[key]) for code, key in keys.items() if key in cached}
+
+        missing = [code for code in exchanged_currencies if code not in rates]
+        if missing:
+            fetched = await self._fetch_rates_async(source_currency, missing, date)
+            await cache.aset_many({keys[code]: str(rate) for code, rate in fetched.items()}, self._rate_cache_timeout(date))
+            rates.update(fetched)
+
+        return rates
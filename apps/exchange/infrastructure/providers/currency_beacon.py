@@ -1,17 +1,128 @@
+import asyncio
+import logging
+import random
+
+import aiohttp
 import requests
 from decimal import Decimal
 from datetime import date
 
 from core.settings import CURRENCY_BEACON_API_KEY, CURRENCY_BEACON_URL
 from apps.exchange.domain.interfaces import BaseExchangeRateProvider
+from apps.exchange.infrastructure.providers.cache import CachedRatesMixin
+from apps.exchange.infrastructure.providers.http import (
+    build_requests_session,
+    loads_json,
+    raise_for_error_status,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
-class CurrencyBeaconProvider(BaseExchangeRateProvider):
+class CurrencyBeaconProvider(CachedRatesMixin, BaseExchangeRateProvider):
     """
     CurrencyBeacon API provider.
-    Uses /historical endpoint to fetch exchange rates for a specific date.
+    Uses /historical endpoint to fetch exchange rates for a specific date,
+    and /timeseries for date ranges.
+
+    Both endpoints accept several symbols per request, so the bulk methods
+    fetch all targets of a source currency in one call, and a whole range
+    takes a single request. Fetched rates are
+    cached, so repeated lookups do not spend API quota.
+
+    Use as an async context manager to share one HTTP session across
+    async calls.
     """
 
+    _session: aiohttp.ClientSession | None = None
+
+    # Retry policy for async calls: transient failures (network errors,
+    # rate limiting, 5xx) are retried with jittered exponential backoff
+    MAX_ATTEMPTS = 4
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 30.0
+    RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+    # Endpoint prefixes with the API key, formatted once; the remaining
+    # parameters (ISO codes and dates) never need quoting
+    HISTORICAL_URL = f"{CURRENCY_BEACON_URL}/historical?api_key={CURRENCY_BEACON_API_KEY}"
+    TIMESERIES_URL = f"{CURRENCY_BEACON_URL}/timeseries?api_key={CURRENCY_BEACON_API_KEY}"
+
+    def __init__(self):
+        # Pooled keep-alive session with retries for the synchronous API
+        self._requests_session = build_requests_session()
+
+    @classmethod
+    def _retry_delay(cls, attempt: int, retry_after: str | None = None) -> float:
+        """
+        Seconds to wait before the next attempt.
+
+        Honors a numeric Retry-After header, otherwise uses full-jitter
+        exponential backoff.
+        """
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), cls.RETRY_MAX_DELAY)
+            except ValueError:
+                pass
+
+        return random.uniform(0, min(cls.RETRY_MAX_DELAY, cls.RETRY_BASE_DELAY * 2 ** attempt))
+
+    @classmethod
+    def _build_url(cls, source_currency: str, exchanged_currencies: list[str], date_str: str) -> str:
+        # Format: https://api.currencybeacon.com/v1/historical?api_key=KEY&base=USD&date=2024-01-15&symbols=EUR,GBP
+        return (
+            f"{cls.HISTORICAL_URL}"
+            f"&base={source_currency}"
+            f"&date={date_str}"
+            f"&symbols={','.join(exchanged_currencies)}"
+        )
+
+    @classmethod
+    def _build_timeseries_url(
+        cls,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date_from: date,
+        date_to: date
+    ) -> str:
+        # Format: https://api.currencybeacon.com/v1/timeseries?api_key=KEY&base=USD&start_date=2024-01-01&end_date=2024-01-31&symbols=EUR,GBP
+        return (
+            f"{cls.TIMESERIES_URL}"
+            f"&base={source_currency}"
+            f"&start_date={date_from.isoformat()}"
+            f"&end_date={date_to.isoformat()}"
+            f"&symbols={','.join(exchanged_currencies)}"
+        )
+
+    @staticmethod
+    def _parse_timeseries(data: dict, exchanged_currencies: list[str]) -> dict[date, dict[str, Decimal]]:
+        # Response format: {"response": {"2024-05-21": {"EUR": 0.85, "GBP": 0.79}, ...}}
+        series = {}
+
+        for date_str, rates in data['response'].items():
+            day_rates = {
+                exchanged_currency: Decimal(rates[exchanged_currency])
+                for exchanged_currency in exchanged_currencies
+                if exchanged_currency in rates
+            }
+            if day_rates:
+                series[date.fromisoformat(date_str)] = day_rates
+
+        return series
+
+    @staticmethod
+    def _parse_rates(data: dict, exchanged_currencies: list[str]) -> dict[str, Decimal]:
+        # Response format: {"response": {"rates": {"EUR": 0.85, "GBP": 0.79}}}
+        # Rates are parsed straight to Decimal by loads_json, never through float
+        rates = data['response']['rates']
+        return {
+            exchanged_currency: Decimal(rates[exchanged_currency])
+            for exchanged_currency in exchanged_currencies
+            if exchanged_currency in rates
+        }
+
     def get_exchange_rate_data(
         self,
         source_currency: str,
@@ -29,34 +140,160 @@ class CurrencyBeaconProvider(BaseExchangeRateProvider):
         Returns:
             Exchange rate as Decimal, or None if error occurs
         """
-        # Format: https://api.currencybeacon.com/v1/historical?api_key=KEY&base=USD&date=2024-01-15&symbols=EUR
+        return self.get_exchange_rates_bulk(source_currency, [exchanged_currency], date).get(exchanged_currency)
+
+    def _fetch_rates(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date: date
+    ) -> dict[str, Decimal]:
+        """
+        Fetch historical rates to several targets with a single /historical request.
+
+        Returns:
+            Rates keyed by target code; targets missing from the response, or
+            all of them if an error occurs, are left out
+        """
         date_str = date.strftime("%Y-%m-%d")
-        url = (
-            f"{CURRENCY_BEACON_URL}/historical"
-            f"?api_key={CURRENCY_BEACON_API_KEY}"
-            f"&base={source_currency}"
-            f"&date={date_str}"
-            f"&symbols={exchanged_currency}"
-        )
+        url = self._build_url(source_currency, exchanged_currencies, date_str)
 
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            response = self._requests_session.get(url, timeout=10)
+            raise_for_error_status(response)
+            return self._parse_rates(loads_json(response.content), exchanged_currencies)
+
+        except requests.exceptions.Timeout:
+            logger.warning("Timeout calling CurrencyBeacon API for %s/%s on %s", source_currency, ",".join(exchanged_currencies), date_str)
+            return {}
+        except requests.exceptions.HTTPError as e:
+            logger.warning("HTTP error from CurrencyBeacon: %s", e)
+            return {}
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Invalid response from CurrencyBeacon: %s", e)
+            return {}
+        except Exception as e:
+            logger.exception("Unexpected error calling CurrencyBeacon: %s", e)
+            return {}
+
+    def _fetch_timeseries(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date_from: date,
+        date_to: date
+    ) -> dict[date, dict[str, Decimal]]:
+        """
+        Fetch rates to several targets over a date range with a single /timeseries request.
 
-            # Response format: {"response": {"rates": {"EUR": 0.85}}}
-            rate = data['response']['rates'][exchanged_currency]
-            return Decimal(str(rate))
+        Returns:
+            Rates keyed by date, then by target code; points missing from the
+            response, or all of them if an error occurs, are left out
+        """
+        url = self._build_timeseries_url(source_currency, exchanged_currencies, date_from, date_to)
+
+        try:
+            response = self._requests_session.get(url, timeout=10)
+            raise_for_error_status(response)
+            return self._parse_timeseries(loads_json(response.content), exchanged_currencies)
 
         except requests.exceptions.Timeout:
-            print(f"Timeout calling CurrencyBeacon API for {source_currency}/{exchanged_currency} on {date_str}")
-            return None
+            logger.warning("Timeout calling CurrencyBeacon API for %s/%s from %s to %s", source_currency, ",".join(exchanged_currencies), date_from, date_to)
+            return {}
         except requests.exceptions.HTTPError as e:
-            print(f"HTTP error from CurrencyBeacon: {e}")
-            return None
-        except (KeyError, ValueError) as e:
-            print(f"Invalid response from CurrencyBeacon: {e}")
-            return None
+            logger.warning("HTTP error from CurrencyBeacon: %s", e)
+            return {}
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Invalid response from CurrencyBeacon: %s", e)
+            return {}
         except Exception as e:
-            print(f"Unexpected error calling CurrencyBeacon: {e}")
-            return None
\ No newline at end of file
+            logger.exception("Unexpected error calling CurrencyBeacon: %s", e)
+            return {}
+
+    async def __aenter__(self):
+        # One pooled session for the whole load: connections and DNS lookups
+        # are reused across requests instead of re-established per call
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit_per_host=64, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=10)
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_exchange_rate_data_async(
+        self,
+        source_currency: str,
+        exchanged_currency: str,
+        date: date
+    ) -> Decimal | None:
+        """
+        Fetch historical exchange rate from CurrencyBeacon API with aiohttp.
+
+        Returns:
+            Exchange rate as Decimal, or None if error occurs
+        """
+        rates = await self.get_exchange_rates_bulk_async(source_currency, [exchanged_currency], date)
+        return rates.get(exchanged_currency)
+
+    async def _fetch_rates_async(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date: date
+    ) -> dict[str, Decimal]:
+        """
+        Fetch historical rates to several targets with a single aiohttp request.
+
+        Uses the session opened by __aenter__, or a one-off session otherwise.
+        Transient failures are retried up to MAX_ATTEMPTS times; permanent
+        ones (e.g. unknown symbol) fail immediately.
+
+        Returns:
+            Rates keyed by target code; targets missing from the response, or
+            all of them if an error occurs, are left out
+        """
+        if self._session is None:
+            async with self:
+                return await self._fetch_rates_async(source_currency, exchanged_currencies, date)
+
+        date_str = date.strftime("%Y-%m-%d")
+        url = self._build_url(source_currency, exchanged_currencies, date_str)
+        symbols = ",".join(exchanged_currencies)
+        error = None
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            retry_after = None
+
+            try:
+                async with self._session.get(url) as response:
+                    if response.status in self.RETRYABLE_STATUSES:
+                        retry_after = response.headers.get("Retry-After")
+                    response.raise_for_status()
+                    # Parse the raw body: skips decoding it to str first
+                    data = loads_json(await response.read())
+
+                return self._parse_rates(data, exchanged_currencies)
+
+            except (asyncio.TimeoutError, aiohttp.ClientConnectionError) as e:
+                error = f"Timeout or connection error calling CurrencyBeacon API for {source_currency}/{symbols} on {date_str}: {e!r}"
+            except aiohttp.ClientResponseError as e:
+                if e.status not in self.RETRYABLE_STATUSES:
+                    logger.warning("HTTP error from CurrencyBeacon: %s", e)
+                    return {}
+                error = f"HTTP error from CurrencyBeacon: {e}"
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning("Invalid response from CurrencyBeacon: %s", e)
+                return {}
+            except Exception as e:
+                logger.exception("Unexpected error calling CurrencyBeacon: %s", e)
+                return {}
+
+            if attempt < self.MAX_ATTEMPTS:
+                await asyncio.sleep(self._retry_delay(attempt, retry_after))
+
+        logger.warning("%s (gave up after %d attempts)", error, self.MAX_ATTEMPTS)
+        return {}
@@ -1,9 +1,19 @@
+import logging
+
 import requests
 from decimal import Decimal
 from datetime import date
 
 from core.settings import EXCHANGERATE_API_KEY, EXCHANGERATE_URL
 from apps.exchange.domain.interfaces import BaseExchangeRateProvider
+from apps.exchange.infrastructure.providers.http import (
+    build_requests_session,
+    loads_json,
+    raise_for_error_status,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class ExchangeRateProvider(BaseExchangeRateProvider):
@@ -12,6 +22,10 @@ class ExchangeRateProvider(BaseExchangeRateProvider):
     Uses /historical endpoint to fetch exchange rates for a specific date.
     """
 
+    def __init__(self):
+        # Pooled keep-alive session with retries: connections are reused across calls
+        self._requests_session = build_requests_session()
+
     def get_exchange_rate_data(
         self,
         source_currency: str,
@@ -32,7 +46,7 @@ class ExchangeRateProvider(BaseExchangeRateProvider):
 
         # if EXCHANGERATE_URL is not configured, return None
         if not EXCHANGERATE_URL or not EXCHANGERATE_API_KEY:
-            print("EXCHANGERATE_URL or EXCHANGERATE_API_KEY is not configured. Cannot fetch exchange rates.")
+            logger.warning("EXCHANGERATE_URL or EXCHANGERATE_API_KEY is not configured. Cannot fetch exchange rates.")
             return None
         
         # Format: https://v6.exchangerate-api.com/v6/YOUR-API-KEY/history/USD/YEAR/MONTH/DAY
@@ -42,23 +56,23 @@ class ExchangeRateProvider(BaseExchangeRateProvider):
         )
 
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            response = self._requests_session.get(url, timeout=10)
+            raise_for_error_status(response)
+            data = loads_json(response.content)
 
             # Response format: {"response": {"rates": {"EUR": 0.85}}}
             rate = data['conversion_rate']
-            return Decimal(str(rate))
+            return Decimal(rate)
 
         except requests.exceptions.Timeout:
-            print(f"Timeout calling ExchangeRate API for {source_currency}/{exchanged_currency} on {date_str}")
+            logger.warning("Timeout calling ExchangeRate API for %s/%s on %s", source_currency, exchanged_currency, date_str)
             return None
         except requests.exceptions.HTTPError as e:
-            print(f"HTTP error from ExchangeRate API: {e}")
+            logger.warning("HTTP error from ExchangeRate API: %s", e)
             return None
         except (KeyError, ValueError) as e:
-            print(f"Invalid response from ExchangeRate API: {e}")
+            logger.warning("Invalid response from ExchangeRate API: %s", e)
             return None
         except Exception as e:
-            print(f"Unexpected error calling ExchangeRate API: {e}")
+            logger.exception("Unexpected error calling ExchangeRate API: %s", e)
             return None
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+Shared HTTP helpers for the provider adapters.
+"""
+
+import json
+from decimal import Decimal
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Transient failures (rate limiting, 5xx) are retried with short exponential
+# backoff. These sessions serve web requests, so Retry-After is ignored and no
+# wait exceeds RETRY_BACKOFF_MAX seconds: a long Retry-After would otherwise
+# hold the request thread for hours. The historical loader fetches through
+# aiohttp with its own retry policy.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_BACKOFF_MAX = 2
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_requests_session() -> requests.Session:
+    """
+    Build a keep-alive session with pooled connections and retries.
+
+    Once retries are exhausted the last response is returned as-is, so
+    callers still see it through raise_for_error_status().
+    """
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            backoff_max=RETRY_BACKOFF_MAX,
+            status_forcelist=RETRY_STATUSES,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def raise_for_error_status(response: requests.Response) -> None:
+    """
+    Raise requests.HTTPError for a 4xx/5xx response.
+
+    Successful responses skip raise_for_status(), which decodes the reason
+    phrase even when there is nothing to raise.
+    """
+    if response.status_code >= 400:
+        response.raise_for_status()
+
+
+def loads_json(body: bytes) -> dict:
+    """
+    Parse a raw JSON response body, reading floats directly as Decimal.
+
+    Parsing the bytes skips the text decoding and encoding detection done by
+    response.json(), and rates never pass through float.
+    """
+    return json.loads(body, parse_float=Decimal)
@@ -3,13 +3,33 @@ Mock provider for testing and fallback.
 Generates random but realistic exchange rates.
 """
 
-import random
+import logging
+import zlib
 from decimal import Decimal
-from datetime import date
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import product
 
 from apps.exchange.domain.interfaces import BaseExchangeRateProvider
 
 
+logger = logging.getLogger(__name__)
+
+# Precision of generated rates
+RATE_QUANTUM = Decimal("0.000001")
+
+
+@lru_cache(maxsize=256)
+def _pair_checksum(source_currency: str, exchanged_currency: str) -> int:
+    """
+    Running CRC-32 of the pair, continued with the date by _varied_rate.
+
+    crc32 of the concatenated string equals crc32 of the date resumed from
+    this value, so the pair's share is computed once, not once per day.
+    """
+    return zlib.crc32(f"{source_currency}{exchanged_currency}".encode())
+
+
 class MockProvider(BaseExchangeRateProvider):
     """
     Mock provider that generates random exchange rates.
@@ -27,6 +47,22 @@ class MockProvider(BaseExchangeRateProvider):
         "CHF": Decimal("0.88"),
     }
 
+    # Cross rates for every supported pair, computed once
+    CROSS_RATES = {
+        (source, target): target_rate / source_rate
+        for (source, source_rate), (target, target_rate) in product(BASE_RATES.items(), repeat=2)
+    }
+
+    @staticmethod
+    def _varied_rate(base_rate: Decimal, pair_checksum: int, date: date) -> Decimal:
+        # Add small pseudo-random variation (±2%), derived from the pair
+        # and date so the same inputs always give the same rate
+        checksum = zlib.crc32(date.isoformat().encode(), pair_checksum)
+        variation = Decimal(980_000 + checksum % 40_001).scaleb(-6)
+
+        # Round to 6 decimal places
+        return (base_rate * variation).quantize(RATE_QUANTUM)
+
     def get_exchange_rate_data(
         self,
         source_currency: str,
@@ -39,32 +75,71 @@ class MockProvider(BaseExchangeRateProvider):
         Args:
             source_currency: Base currency code
             exchanged_currency: Target currency code
-            date: Date for the rate (used for seeding randomness)
+            date: Date for the rate (used to derive the variation)
 
         Returns:
             Mock exchange rate as Decimal
         """
+        if source_currency == exchanged_currency and source_currency in self.BASE_RATES:
+            return Decimal(1)
+
         try:
-            # Get base rates for both currencies (relative to USD)
-            source_rate = self.BASE_RATES.get(source_currency)
-            target_rate = self.BASE_RATES.get(exchanged_currency)
+            base_rate = self.CROSS_RATES.get((source_currency, exchanged_currency))
 
-            if source_rate is None or target_rate is None:
-                print(f"MockProvider: Unsupported currency pair {source_currency}/{exchanged_currency}")
+            if base_rate is None:
+                logger.warning("MockProvider: Unsupported currency pair %s/%s", source_currency, exchanged_currency)
                 return None
 
-            # Calculate cross rate
-            base_rate = target_rate / source_rate
-
-            # Add small random variation (±2%)
-            # Use date as seed for reproducibility
-            random.seed(f"{source_currency}{exchanged_currency}{date}")
-            variation = Decimal(str(random.uniform(0.98, 1.02)))
-            mock_rate = base_rate * variation
-
-            # Round to 6 decimal places
-            return mock_rate.quantize(Decimal("0.000001"))
+            return self._varied_rate(base_rate, _pair_checksum(source_currency, exchanged_currency), date)
 
         except Exception as e:
-            print(f"Error in MockProvider: {e}")
+            logger.exception("Error in MockProvider: %s", e)
             return None
+
+    def get_exchange_rates_timeseries(
+        self,
+        source_currency: str,
+        exchanged_currencies: list[str],
+        date_from: date,
+        date_to: date
+    ) -> dict[date, dict[str, Decimal]]:
+        """
+        Generate a whole series in one pass, giving the same rates as
+        get_exchange_rate_data. Each target's cross rate and pair checksum
+        are computed once for the range instead of once per day.
+        """
+        base_rates = {
+            exchanged_currency: (
+                self.CROSS_RATES[(source_currency, exchanged_currency)],
+                _pair_checksum(source_currency, exchanged_currency)
+            )
+            for exchanged_currency in exchanged_currencies
+            if (source_currency, exchanged_currency) in self.CROSS_RATES
+        }
+
+        if not base_rates:
+            return {}
+
+        series = {}
+        current_date = date_from
+
+        while current_date <= date_to:
+            series[current_date] = {
+                exchanged_currency: (
+                    Decimal(1) if exchanged_currency == source_currency
+                    else self._varied_rate(base_rate, pair_checksum, current_date)
+                )
+                for exchanged_currency, (base_rate, pair_checksum) in base_rates.items()
+            }
+            current_date += timedelta(days=1)
+
+        return series
+
+    async def get_exchange_rate_data_async(
+        self,
+        source_currency: str,
+        exchanged_currency: str,
+        date: date
+    ) -> Decimal | None:
+        """Rates are computed in memory, so no worker thread is needed."""
+        return self.get_exchange_rate_data(source_currency, exchanged_currency, date)
@@ -3,13 +3,18 @@ Provider Registry - Maps ProviderName enum to adapter classes.
 This is the glue between the database Provider model and the actual implementation.
 """
 
+import logging
+from functools import lru_cache
+
 from apps.exchange.infrastructure.persistence.models import ProviderName
 from apps.exchange.domain.interfaces import BaseExchangeRateProvider
 from apps.exchange.infrastructure.providers.currency_beacon import CurrencyBeaconProvider
 from apps.exchange.infrastructure.providers.mock import MockProvider
 from apps.exchange.infrastructure.providers.exchange_rate import ExchangeRateProvider
-from apps.exchange.infrastructure.persistence.models import Provider
+from apps.exchange.infrastructure.persistence.repositories import ProviderRepository
+
 
+logger = logging.getLogger(__name__)
 
 PROVIDER_REGISTRY: dict[str, type[BaseExchangeRateProvider]] = {
     ProviderName.CURRENCY_BEACON: CurrencyBeaconProvider,
@@ -18,9 +23,13 @@ PROVIDER_REGISTRY: dict[str, type[BaseExchangeRateProvider]] = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_provider_instance(provider_name: str) -> BaseExchangeRateProvider | None:
     """
-    Get an instance of a provider by its name.
+    Get the shared instance of a provider by its name.
+
+    Instances are memoized so each provider keeps its HTTP session, and
+    its pooled connections, across calls.
 
     Args:
         provider_name: The provider name from ProviderName enum
@@ -32,29 +41,36 @@ def get_provider_instance(provider_name: str) -> BaseExchangeRateProvider | None
     provider_class = PROVIDER_REGISTRY.get(provider_name)
 
     if provider_class is None:
-        print(f"Provider '{provider_name}' not found in registry")
+        logger.warning("Provider '%s' not found in registry", provider_name)
         return None
 
     return provider_class()
 
 
-def get_active_providers_ordered() -> list[BaseExchangeRateProvider]:
+@lru_cache(maxsize=None)
+def _providers_for_names(provider_names: tuple[str, ...]) -> tuple[BaseExchangeRateProvider, ...]:
     """
-    Get all active providers from the database, ordered by priority.
+    Resolve an ordered tuple of provider names to their adapter instances,
+    skipping names missing from the registry.
+
+    Memoized per name tuple, so the list is only built again when the active
+    providers or their priorities change.
+    """
+    return tuple(
+        instance
+        for instance in map(get_provider_instance, provider_names)
+        if instance is not None
+    )
 
-    Returns:
-        List of provider instances, sorted by priority (lowest number = highest priority)
 
+def get_active_providers_ordered() -> tuple[BaseExchangeRateProvider, ...]:
     """
+    Get all active providers from the database, ordered by priority.
 
-    # Query active providers ordered by priority
-    active_providers = Provider.objects.filter(is_active=True).order_by('priority')
+    Returns:
+        Tuple of provider instances, sorted by priority (lowest number = highest priority)
 
-    # Instantiate each provider adapter
-    provider_instances = []
-    for provider_model in active_providers:
-        instance = get_provider_instance(provider_model.name)
-        if instance is not None:
-            provider_instances.append(instance)
+    """
 
-    return provider_instances
+    # Active provider names ordered by priority (cached, invalidated by signals)
+    return _providers_for_names(tuple(ProviderRepository.get_active_names()))
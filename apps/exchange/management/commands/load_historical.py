@@ -1,7 +1,7 @@
 from datetime import date
 from django.core.management.base import BaseCommand, CommandError
 
-from apps.exchange.application.tasks import load_historical_data
+from apps.exchange.application.tasks import dispatch_historical_load, load_historical_data
 
 
 class Command(BaseCommand):
@@ -67,8 +67,8 @@ class Command(BaseCommand):
             else:
                 raise CommandError(f"Failed: {result.get('message', 'Unknown error')}")
         else:
-            self.stdout.write('Dispatching Celery task...')
-            task = load_historical_data.delay(date_from_str, date_to_str)
+            self.stdout.write('Dispatching Celery tasks...')
+            task = dispatch_historical_load(date_from, date_to)
 
             self.stdout.write(
                 self.style.SUCCESS(
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.11 on 2026-10-15 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange', '0002_auto_20260215_0957'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='provider',
+            name='name',
+            field=models.CharField(choices=[('currency_beacon', 'CurrencyBeacon'), ('mock', 'Mock'), ('exchange_rate', 'ExchangeRate')], max_length=50, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='currencyexchangerate',
+            index=models.Index(fields=['source_currency', 'valuation_date'], name='rate_source_date_idx'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.11 on 2026-10-15 07:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange', '0003_currencyexchangerate_source_date_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='currencyexchangerate',
+            name='rate_value',
+            field=models.DecimalField(decimal_places=6, max_digits=18),
+        ),
+        migrations.AddIndex(
+            model_name='currencyexchangerate',
+            index=models.Index(fields=['source_currency', 'exchanged_currency', 'valuation_date'], include=('rate_value',), name='rate_covering_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.11 on 2026-10-15 07:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange', '0004_rate_covering_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='currencyexchangerate',
+            name='rate_source_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='currencyexchangerate',
+            index=models.Index(fields=['source_currency', 'valuation_date', 'exchanged_currency'], include=('rate_value',), name='rate_source_date_cover_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.11 on 2026-10-15 07:59
+
+import apps.exchange.infrastructure.persistence.models
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exchange', '0005_rate_source_date_covering_index'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='currencyexchangerate',
+            name='unique_rate_per_day',
+        ),
+        migrations.RemoveIndex(
+            model_name='currencyexchangerate',
+            name='rate_covering_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='currencyexchangerate',
+            constraint=apps.exchange.infrastructure.persistence.models.CoveringUniqueConstraint(fields=('source_currency', 'exchanged_currency', 'valuation_date'), include=('rate_value',), name='unique_rate_per_day'),
+        ),
+    ]
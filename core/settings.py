@@ -155,9 +155,73 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# Shared Redis cache when available so web and worker processes see the same
+# entries; falls back to a per-process in-memory cache otherwise.
+# The cache needs its own Redis database, apart from the Celery broker and
+# result backend: cache.clear() runs FLUSHDB on it.
+
+if os.environ.get("CACHE_REDIS_URL"):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get("CACHE_REDIS_URL"),
+            'KEY_PREFIX': 'mycurrency',
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+
+# Logging
+# https://docs.djangoproject.com/en/5.2/topics/logging/
+# Application and Celery task logs go to the console at LOG_LEVEL (INFO by
+# default); per-rate debug messages are skipped unless it is set to DEBUG.
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'apps': {
+            'handlers': ['console'],
+            'level': os.environ.get('LOG_LEVEL', 'INFO'),
+        },
+    },
+}
+
+
 # Currency Beacon API Configuration
 
 CURRENCY_BEACON_API_KEY = os.environ.get('CURRENCY_BEACON_KEY')
 CURRENCY_BEACON_URL = os.environ.get('CURRENCY_BEACON_URL')
 EXCHANGERATE_API_KEY = os.environ.get('EXCHANGERATE_KEY')
-EXCHANGERATE_URL = os.environ.get('EXCHANGERATE_URL')
\ No newline at end of file
+EXCHANGERATE_URL = os.environ.get('EXCHANGERATE_URL')
+
+# Bounds on concurrent provider requests while loading historical data. The
+# limit adapts between them from observed latency (seconds) and failures, to
+# stay under the providers' rate limits
+HISTORICAL_LOAD_MIN_CONCURRENCY = int(os.environ.get('HISTORICAL_LOAD_MIN_CONCURRENCY', '4'))
+HISTORICAL_LOAD_MAX_CONCURRENCY = int(os.environ.get('HISTORICAL_LOAD_MAX_CONCURRENCY', '64'))
+HISTORICAL_LOAD_TARGET_LATENCY = float(os.environ.get('HISTORICAL_LOAD_TARGET_LATENCY', '1.0'))
+
+# Days loaded by each subtask when a historical load is dispatched to Celery
+HISTORICAL_LOAD_CHUNK_DAYS = int(os.environ.get('HISTORICAL_LOAD_CHUNK_DAYS', '30'))
+
+# Worker processes used to build rate rows during a historical load; 0 builds
+# them in the task's own process. Not usable inside daemonic Celery prefork
+# workers, which cannot start child processes
+HISTORICAL_LOAD_PROCESS_WORKERS = int(os.environ.get('HISTORICAL_LOAD_PROCESS_WORKERS', '0'))
+
+# Rows per INSERT for bulk writes, so large loads are split into statements
+# that stay within database parameter limits and worker memory
+BULK_CREATE_BATCH_SIZE = int(os.environ.get('BULK_CREATE_BATCH_SIZE', '1000'))
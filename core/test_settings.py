@@ -0,0 +1,14 @@
+"""
+Django settings for the test suite.
+"""
+
+from core.settings import *  # noqa: F401,F403
+
+
+# Tests clear the cache around every test: keep it in process, never on a
+# Redis instance shared with other services
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
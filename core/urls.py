@@ -15,6 +15,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.urls import path, include
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 from apps.exchange.admin import admin_site
 
@@ -22,7 +23,8 @@ urlpatterns = [
     path('admin/', admin_site.urls),
 
     # Documentation
-    path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
+    # Schema only changes with the code, so generate it once per hour at most
+    path('api/schema/', cache_page(60 * 60)(SpectacularAPIView.as_view()), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
 
     # Versioned API
@@ -5,7 +5,7 @@ from rest_framework import status
 from apps.exchange.infrastructure.persistence.models import Provider, ProviderName
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestProviderPriorityValidation:
     """Tests for provider priority duplicate validation."""
 
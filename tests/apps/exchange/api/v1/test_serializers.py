@@ -4,7 +4,8 @@ from datetime import date
 from apps.exchange.api.v1.serializers import (
     CurrencySerializer,
     CurrencyExchangeRateSerializer,
-    ProviderSerializer
+    ProviderSerializer,
+    ConverterInputSerializer
 )
 from apps.exchange.infrastructure.persistence.models import (
     Currency,
@@ -14,28 +15,28 @@ from apps.exchange.infrastructure.persistence.models import (
 )
 
 
+# Shared test values, built once per module
+USD_EUR_RATE = Decimal("0.850000")
+VALUATION_DATE = date(2024, 5, 21)
+
+
 @pytest.fixture
-def currencies(db):
-    """Create test currencies."""
-    Currency.objects.all().delete()
-    usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-    eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
-    return {"USD": usd, "EUR": eur}
+def unsaved_currencies():
+    """In-memory currencies for serialization-only tests; nothing touches the database."""
+    return {
+        "USD": Currency(code="USD", name="US Dollar", symbol="$"),
+        "EUR": Currency(code="EUR", name="Euro", symbol="€"),
+    }
 
 
-@pytest.mark.django_db(transaction=True)
 class TestCurrencySerializer:
     """Tests for CurrencySerializer."""
 
-    def setup_method(self):
-        """Clean up before each test."""
-        Currency.objects.all().delete()
-
-    def test_serialize_currency(self, currencies):
+    def test_serialize_currency(self, unsaved_currencies):
         """
         Test that CurrencySerializer correctly serializes a Currency instance.
         """
-        serializer = CurrencySerializer(currencies["USD"])
+        serializer = CurrencySerializer(unsaved_currencies["USD"])
         data = serializer.data
 
         assert data["code"] == "USD"
@@ -45,38 +46,41 @@ class TestCurrencySerializer:
         assert "created_at" in data
         assert "updated_at" in data
 
+    @pytest.mark.django_db
     def test_deserialize_currency(self):
         """
         Test that CurrencySerializer correctly deserializes data.
         """
         data = {
-            "code": "gbp",
-            "name": "British Pound",
-            "symbol": "£"
+            "code": "jpy",
+            "name": "Japanese Yen",
+            "symbol": "¥"
         }
         serializer = CurrencySerializer(data=data)
 
         assert serializer.is_valid()
         currency = serializer.save()
 
-        assert currency.code == "GBP"  # Should be uppercased
-        assert currency.name == "British Pound"
-        assert currency.symbol == "£"
+        assert currency.code == "JPY"  # Should be uppercased
+        assert currency.name == "Japanese Yen"
+        assert currency.symbol == "¥"
 
+    @pytest.mark.django_db
     def test_validate_code_uppercase(self):
         """
         Test that currency code is converted to uppercase.
         """
         data = {
-            "code": "chf",
-            "name": "Swiss Franc",
-            "symbol": "CHF"
+            "code": "sek",
+            "name": "Swedish Krona",
+            "symbol": "kr"
         }
         serializer = CurrencySerializer(data=data)
 
         assert serializer.is_valid()
-        assert serializer.validated_data["code"] == "CHF"
+        assert serializer.validated_data["code"] == "SEK"
 
+    @pytest.mark.django_db
     def test_read_only_fields(self, currencies):
         """
         Test that id, created_at, and updated_at are read-only.
@@ -101,59 +105,51 @@ class TestCurrencySerializer:
         assert currency.symbol == "$$"
 
 
-@pytest.mark.django_db(transaction=True)
 class TestCurrencyExchangeRateSerializer:
-    """Tests for CurrencyExchangeRateSerializer."""
+    """Tests for CurrencyExchangeRateSerializer; rates are built in memory."""
 
-    def setup_method(self):
-        """Clean up before each test."""
-        CurrencyExchangeRate.objects.all().delete()
-        Currency.objects.all().delete()
-
-    def test_serialize_exchange_rate(self, currencies):
+    def test_serialize_exchange_rate(self, unsaved_currencies):
         """
         Test that CurrencyExchangeRateSerializer correctly serializes a rate.
         """
-        rate = CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date(2024, 5, 21),
-            rate_value=Decimal("0.850000")
+        rate = CurrencyExchangeRate(
+            source_currency=unsaved_currencies["USD"],
+            exchanged_currency=unsaved_currencies["EUR"],
+            valuation_date=VALUATION_DATE,
+            rate_value=USD_EUR_RATE
         )
 
         serializer = CurrencyExchangeRateSerializer(rate)
         data = serializer.data
 
-        assert data["source_currency"]["code"] == "USD"
-        assert data["exchanged_currency"]["code"] == "EUR"
+        assert data["source_currency"] == "USD"
+        assert data["exchanged_currency"] == "EUR"
         assert data["valuation_date"] == "2024-05-21"
-        assert Decimal(data["rate_value"]) == Decimal("0.850000")
+        assert Decimal(data["rate_value"]) == USD_EUR_RATE
         assert "id" in data
         assert "created_at" in data
         assert "updated_at" in data
 
-    def test_nested_currency_serialization(self, currencies):
+    def test_currency_serialized_as_code(self, unsaved_currencies):
         """
-        Test that nested currencies are fully serialized.
+        Test that related currencies are serialized as their codes only.
         """
-        rate = CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date(2024, 5, 21),
-            rate_value=Decimal("0.850000")
+        rate = CurrencyExchangeRate(
+            source_currency=unsaved_currencies["USD"],
+            exchanged_currency=unsaved_currencies["EUR"],
+            valuation_date=VALUATION_DATE,
+            rate_value=USD_EUR_RATE
         )
 
         serializer = CurrencyExchangeRateSerializer(rate)
         data = serializer.data
 
-        # Nested currencies should have full details
-        assert "name" in data["source_currency"]
-        assert "symbol" in data["source_currency"]
-        assert data["source_currency"]["name"] == "US Dollar"
-        assert data["exchanged_currency"]["symbol"] == "€"
+        # Currencies are flattened to their code, no nested details
+        assert data["source_currency"] == "USD"
+        assert data["exchanged_currency"] == "EUR"
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestProviderSerializer:
     """Tests for ProviderSerializer."""
 
@@ -239,3 +235,60 @@ class TestProviderSerializer:
 
         assert updated_provider.priority == 5
         assert updated_provider.is_active is False
+
+
+class TestConverterInputSerializer:
+    """Tests for ConverterInputSerializer."""
+
+    def test_valid_input(self):
+        """
+        Test that valid converter input is parsed once into typed values.
+        """
+        serializer = ConverterInputSerializer(data={
+            "source_currency": "USD",
+            "amount": "100.5",
+            "target_currencies": ["EUR", "GBP"],
+            "valuation_date": "2024-05-21",
+        })
+
+        assert serializer.is_valid()
+        assert serializer.validated_data["amount"] == Decimal("100.5")
+        assert serializer.validated_data["target_currencies"] == ["EUR", "GBP"]
+        assert serializer.validated_data["valuation_date"] == VALUATION_DATE
+
+    def test_valuation_date_optional(self):
+        """
+        Test that valuation_date may be omitted.
+        """
+        serializer = ConverterInputSerializer(data={
+            "source_currency": "USD",
+            "amount": "100",
+            "target_currencies": ["EUR"],
+            "valuation_date": None,
+        })
+
+        assert serializer.is_valid()
+        assert serializer.validated_data["valuation_date"] is None
+
+    @pytest.mark.parametrize("field, value", [
+        ("amount", "abc"),
+        ("amount", "0"),
+        ("amount", "-5"),
+        ("target_currencies", []),
+        ("valuation_date", "21-05-2024"),
+    ])
+    def test_invalid_input(self, field, value):
+        """
+        Test that malformed or non-positive input is rejected.
+        """
+        data = {
+            "source_currency": "USD",
+            "amount": "100",
+            "target_currencies": ["EUR"],
+        }
+        data[field] = value
+
+        serializer = ConverterInputSerializer(data=data)
+
+        assert not serializer.is_valid()
+        assert field in serializer.errors
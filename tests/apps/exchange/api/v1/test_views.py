@@ -1,11 +1,12 @@
 import pytest
 from decimal import Decimal
 from datetime import date
-from unittest.mock import patch
 
+from django.test import RequestFactory
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from apps.exchange.api.v1.views import CurrencyExchangeRateViewSet
 from apps.exchange.infrastructure.persistence.models import (
     Currency,
     CurrencyExchangeRate,
@@ -14,110 +15,170 @@ from apps.exchange.infrastructure.persistence.models import (
 )
 
 
-@pytest.fixture
+# Shared test values, built once per module
+USD_EUR_RATE = Decimal("0.850000")
+AMOUNT = Decimal("100")
+VALUATION_DATE = date(2024, 5, 21)
+MOCK = ProviderName.MOCK
+BEACON = ProviderName.CURRENCY_BEACON
+
+
+@pytest.fixture(scope="module")
 def api_client():
-    """DRF API client."""
+    """DRF API client, shared by the tests in this module."""
     return APIClient()
 
 
-@pytest.fixture
-def currencies(db):
-    """Create test currencies."""
-    Currency.objects.all().delete()
-    usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-    eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
-    gbp = Currency.objects.create(code="GBP", name="British Pound", symbol="£")
-    return {"USD": usd, "EUR": eur, "GBP": gbp}
+@pytest.fixture(autouse=True)
+def reset_api_client(api_client):
+    """Clear any credentials or cookies a test left on the shared client."""
+    yield
+    api_client.logout()
 
 
-@pytest.fixture
-def mock_provider_active(db):
-    """Create active mock provider in DB."""
-    Provider.objects.all().delete()
-    return Provider.objects.create(
-        name=ProviderName.MOCK,
-        priority=1,
-        is_active=True
-    )
+@pytest.fixture(scope="module")
+def call_rates_action():
+    """
+    Call a CurrencyExchangeRateViewSet action directly with a factory request,
+    skipping URL routing and middleware. Used by the validation error tests.
+    """
+    factory = RequestFactory()
+
+    def call(action, params=None):
+        view = CurrencyExchangeRateViewSet.as_view({"get": action})
+        return view(factory.get("/", params or {}))
+
+    return call
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.fixture
+def mock_convert_amount(mocker):
+    """Patch ExchangeRateService.convert_amount as called by the v1 views."""
+    return mocker.patch('apps.exchange.api.v1.views.ExchangeRateService.convert_amount')
+
+
+def response_fields(data, fields):
+    """
+    Values of the given fields in a response body, as a tuple, or a list of
+    tuples for list responses. Empty bodies give None.
+    """
+    if data is None:
+        return None
+    if isinstance(data, list):
+        return [response_fields(item, fields) for item in data]
+    return tuple(data[field] for field in fields)
+
+
+# (method, currency code for detail URLs, payload, expected status,
+#  response fields, expected field values, stored currency codes afterwards)
+CURRENCY_CRUD_CASES = [
+    pytest.param(
+        "get", None, None, status.HTTP_200_OK,
+        ("code",), [("EUR",), ("GBP",), ("USD",)],
+        {"USD", "EUR", "GBP"},
+        id="list"
+    ),
+    pytest.param(
+        "get", "USD", None, status.HTTP_200_OK,
+        ("code", "name"), ("USD", "US Dollar"),
+        {"USD", "EUR", "GBP"},
+        id="retrieve"
+    ),
+    pytest.param(
+        "post", None, {"code": "CHF", "name": "Swiss Franc", "symbol": "CHF"}, status.HTTP_201_CREATED,
+        ("code", "name", "symbol"), ("CHF", "Swiss Franc", "CHF"),
+        {"USD", "EUR", "GBP", "CHF"},
+        id="create"
+    ),
+    pytest.param(
+        "put", "USD", {"code": "USD", "name": "United States Dollar", "symbol": "$"}, status.HTTP_200_OK,
+        ("code", "name", "symbol"), ("USD", "United States Dollar", "$"),
+        {"USD", "EUR", "GBP"},
+        id="update"
+    ),
+    pytest.param(
+        "delete", "GBP", None, status.HTTP_204_NO_CONTENT,
+        ("code",), None,
+        {"USD", "EUR"},
+        id="delete"
+    ),
+]
+
+# Fields compared on provider responses and stored providers
+PROVIDER_FIELDS = ("name", "priority", "is_active")
+
+# (method, existing providers, provider name for detail URLs, payload, expected status,
+#  expected response values, stored providers afterwards)
+PROVIDER_CRUD_CASES = [
+    pytest.param(
+        "get", [(MOCK, 1, True), (BEACON, 2, False)], None, None, status.HTTP_200_OK,
+        [(MOCK, 1, True), (BEACON, 2, False)],
+        {(MOCK, 1, True), (BEACON, 2, False)},
+        id="list"
+    ),
+    pytest.param(
+        "get", [(MOCK, 1, True)], MOCK, None, status.HTTP_200_OK,
+        (MOCK, 1, True),
+        {(MOCK, 1, True)},
+        id="retrieve"
+    ),
+    pytest.param(
+        "post", [], None, {"name": MOCK, "priority": 1, "is_active": True}, status.HTTP_201_CREATED,
+        (MOCK, 1, True),
+        {(MOCK, 1, True)},
+        id="create"
+    ),
+    pytest.param(
+        "put", [(MOCK, 1, True)], MOCK, {"name": MOCK, "priority": 5, "is_active": False}, status.HTTP_200_OK,
+        (MOCK, 5, False),
+        {(MOCK, 5, False)},
+        id="update"
+    ),
+    pytest.param(
+        "delete", [(MOCK, 1, True)], MOCK, None, status.HTTP_204_NO_CONTENT,
+        None,
+        set(),
+        id="delete"
+    ),
+]
+
+
+@pytest.mark.django_db
 class TestCurrencyViewSet:
     """Tests for CurrencyViewSet endpoints."""
 
     def setup_method(self):
-        """Clean up before each test."""
-        Currency.objects.all().delete()
-
-    def test_list_currencies(self, api_client, currencies):
-        """
-        Test GET /api/v1/exchange/currencies/ lists all currencies.
-        """
-        response = api_client.get("/api/v1/exchange/currencies/")
-
-        assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3
+        """Drop seeded currencies other than the session reference ones."""
+        Currency.objects.exclude(code__in=("USD", "EUR", "GBP")).delete()
 
-    def test_retrieve_currency(self, api_client, currencies):
-        """
-        Test GET /api/v1/exchange/currencies/{id}/ retrieves a single currency.
-        """
-        currency_id = currencies["USD"].id
-        response = api_client.get(f"/api/v1/exchange/currencies/{currency_id}/")
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["code"] == "USD"
-        assert response.data["name"] == "US Dollar"
-
-    def test_create_currency(self, api_client):
-        """
-        Test POST /api/v1/exchange/currencies/ creates a new currency.
-        """
-        data = {
-            "code": "CHF",
-            "name": "Swiss Franc",
-            "symbol": "CHF"
-        }
-        response = api_client.post("/api/v1/exchange/currencies/", data)
-
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data["code"] == "CHF"
-        assert Currency.objects.filter(code="CHF").exists()
-
-    def test_update_currency(self, api_client, currencies):
+    @pytest.mark.parametrize(
+        "method, code, payload, expected_status, fields, expected_data, expected_codes", CURRENCY_CRUD_CASES
+    )
+    def test_crud(
+        self, api_client, currencies, method, code, payload, expected_status, fields, expected_data, expected_codes
+    ):
         """
-        Test PUT /api/v1/exchange/currencies/{id}/ updates a currency.
+        Test list, retrieve, create, update and delete on /api/v1/exchange/currencies/.
         """
-        currency_id = currencies["USD"].id
-        data = {
-            "code": "USD",
-            "name": "United States Dollar",
-            "symbol": "$"
-        }
-        response = api_client.put(f"/api/v1/exchange/currencies/{currency_id}/", data)
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["name"] == "United States Dollar"
+        url = "/api/v1/exchange/currencies/"
+        if code is not None:
+            url += f"{currencies[code].id}/"
 
-    def test_delete_currency(self, api_client, currencies):
-        """
-        Test DELETE /api/v1/exchange/currencies/{id}/ deletes a currency.
-        """
-        currency_id = currencies["GBP"].id
-        response = api_client.delete(f"/api/v1/exchange/currencies/{currency_id}/")
+        response = getattr(api_client, method)(url, payload)
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert not Currency.objects.filter(id=currency_id).exists()
+        assert response.status_code == expected_status
+        assert response_fields(response.data, fields) == expected_data
+        assert set(Currency.objects.values_list("code", flat=True)) == expected_codes
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestCurrencyExchangeRateViewSet:
     """Tests for CurrencyExchangeRateViewSet endpoints."""
 
     def setup_method(self):
         """Clean up before each test."""
-        CurrencyExchangeRate.objects.all().delete()
-        Currency.objects.all().delete()
+        # No seeded providers, so only stored rates are returned
+        Provider.objects.all().delete()
 
     def test_list_rates(self, api_client, currencies):
         """
@@ -126,14 +187,59 @@ class TestCurrencyExchangeRateViewSet:
         CurrencyExchangeRate.objects.create(
             source_currency=currencies["USD"],
             exchanged_currency=currencies["EUR"],
-            valuation_date=date(2024, 5, 21),
-            rate_value=Decimal("0.850000")
+            valuation_date=VALUATION_DATE,
+            rate_value=USD_EUR_RATE
         )
 
         response = api_client.get("/api/v1/exchange/rates/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 1
+        data = response.data
+        assert data["count"] == 1
+        assert len(data["results"]) == 1
+        assert data["next"] is None
+
+    def test_list_rates_paginated(self, api_client, currencies):
+        """
+        Test GET /api/v1/exchange/rates/?limit= returns a paginated page.
+        """
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=date(2024, 5, day),
+                rate_value=USD_EUR_RATE
+            )
+            for day in (21, 22, 23)
+        ])
+
+        response = api_client.get("/api/v1/exchange/rates/", {"limit": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data
+        assert data["count"] == 3
+        assert len(data["results"]) == 2
+        assert data["next"] is not None
+
+    def test_list_rates_single_query(self, api_client, currencies, django_assert_num_queries):
+        """
+        Test listing rates does not issue per-row queries for currencies: one
+        COUNT for the page links and one SELECT for the page.
+        """
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies[target],
+                valuation_date=VALUATION_DATE,
+                rate_value=USD_EUR_RATE
+            )
+            for target in ("EUR", "GBP")
+        ])
+
+        with django_assert_num_queries(2):
+            response = api_client.get("/api/v1/exchange/rates/")
+
+        assert {rate["exchanged_currency"] for rate in response.data["results"]} == {"EUR", "GBP"}
 
     def test_retrieve_rate(self, api_client, currencies):
         """
@@ -142,39 +248,35 @@ class TestCurrencyExchangeRateViewSet:
         rate = CurrencyExchangeRate.objects.create(
             source_currency=currencies["USD"],
             exchanged_currency=currencies["EUR"],
-            valuation_date=date(2024, 5, 21),
-            rate_value=Decimal("0.850000")
+            valuation_date=VALUATION_DATE,
+            rate_value=USD_EUR_RATE
         )
 
         response = api_client.get(f"/api/v1/exchange/rates/{rate.id}/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["source_currency"]["code"] == "USD"
-        assert response.data["exchanged_currency"]["code"] == "EUR"
+        data = response.data
+        assert data["source_currency"] == "USD"
+        assert data["exchanged_currency"] == "EUR"
 
     def test_time_series_success(self, api_client, currencies):
         """
         Test GET /api/v1/exchange/rates/time-series/ returns rates within date range.
         """
         # Create rates for different dates
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date(2024, 5, 21),
-            rate_value=Decimal("0.850000")
-        )
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date(2024, 5, 22),
-            rate_value=Decimal("0.851000")
-        )
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["GBP"],
-            valuation_date=date(2024, 5, 21),
-            rate_value=Decimal("0.730000")
-        )
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies[target],
+                valuation_date=valuation_date,
+                rate_value=Decimal(rate_value)
+            )
+            for target, valuation_date, rate_value in (
+                ("EUR", VALUATION_DATE, "0.850000"),
+                ("EUR", date(2024, 5, 22), "0.851000"),
+                ("GBP", VALUATION_DATE, "0.730000"),
+            )
+        ])
 
         response = api_client.get(
             "/api/v1/exchange/rates/time-series/",
@@ -186,24 +288,32 @@ class TestCurrencyExchangeRateViewSet:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["source_currency"] == "USD"
-        assert len(response.data["rates"]) == 3  # 2 EUR + 1 GBP
-
-    def test_time_series_missing_params(self, api_client):
+        data = response.data
+        assert data["source_currency"] == "USD"
+        assert data["total_rates"] == 3  # 2 EUR + 1 GBP
+        assert data["rates"]["EUR"] == [
+            {"valuation_date": "2024-05-21", "rate_value": "0.850000"},
+            {"valuation_date": "2024-05-22", "rate_value": "0.851000"},
+        ]
+        assert data["rates"]["GBP"] == [
+            {"valuation_date": "2024-05-21", "rate_value": "0.730000"},
+        ]
+
+    def test_time_series_missing_params(self, call_rates_action):
         """
         Test time-series endpoint returns 400 when required params are missing.
         """
-        response = api_client.get("/api/v1/exchange/rates/time-series/")
+        response = call_rates_action("time_series")
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
-    def test_time_series_invalid_date_format(self, api_client):
+    def test_time_series_invalid_date_format(self, call_rates_action):
         """
         Test time-series endpoint returns 400 for invalid date format.
         """
-        response = api_client.get(
-            "/api/v1/exchange/rates/time-series/",
+        response = call_rates_action(
+            "time_series",
             {
                 "source_currency": "USD",
                 "date_from": "21-05-2024",  # Wrong format
@@ -214,12 +324,12 @@ class TestCurrencyExchangeRateViewSet:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
-    def test_time_series_date_from_after_date_to(self, api_client):
+    def test_time_series_date_from_after_date_to(self, call_rates_action):
         """
         Test time-series endpoint returns 400 when date_from > date_to.
         """
-        response = api_client.get(
-            "/api/v1/exchange/rates/time-series/",
+        response = call_rates_action(
+            "time_series",
             {
                 "source_currency": "USD",
                 "date_from": "2024-05-25",
@@ -230,6 +340,22 @@ class TestCurrencyExchangeRateViewSet:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
+    def test_time_series_range_too_large(self, call_rates_action):
+        """
+        Test time-series endpoint returns 400 when the date range is too wide.
+        """
+        response = call_rates_action(
+            "time_series",
+            {
+                "source_currency": "USD",
+                "date_from": "2023-01-01",
+                "date_to": "2024-12-31"
+            }
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "error" in response.data
+
     def test_time_series_currency_not_found(self, api_client):
         """
         Test time-series endpoint returns 404 when currency doesn't exist.
@@ -246,18 +372,17 @@ class TestCurrencyExchangeRateViewSet:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert "error" in response.data
 
-    @patch('apps.exchange.api.v1.views.ExchangeRateService.convert_amount')
-    def test_convert_success(self, mock_convert, api_client):
+    def test_convert_success(self, mock_convert_amount, api_client, currencies):
         """
         Test GET /api/v1/exchange/rates/convert/ successfully converts amount.
         """
-        mock_convert.return_value = {
+        mock_convert_amount.return_value = {
             "source_currency": "USD",
             "exchanged_currency": "EUR",
-            "amount": Decimal("100"),
-            "rate": Decimal("0.850000"),
+            "amount": AMOUNT,
+            "rate": USD_EUR_RATE,
             "converted_amount": Decimal("85.000000"),
-            "valuation_date": date(2024, 5, 21)
+            "valuation_date": VALUATION_DATE
         }
 
         response = api_client.get(
@@ -271,30 +396,32 @@ class TestCurrencyExchangeRateViewSet:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["source_currency"] == "USD"
-        assert response.data["exchanged_currency"] == "EUR"
-        assert response.data["amount"] == "100"
-        assert response.data["rate"] == "0.850000"
-        assert response.data["converted_amount"] == "85.000000"
+        data = response.data
+        assert data["source_currency"] == "USD"
+        assert data["exchanged_currency"] == "EUR"
+        assert data["amount"] == "100"
+        assert data["rate"] == "0.850000"
+        assert data["converted_amount"] == "85.000000"
+        mock_convert_amount.assert_called_once_with("USD", "EUR", AMOUNT, VALUATION_DATE)
 
-    def test_convert_missing_params(self, api_client):
+    def test_convert_missing_params(self, call_rates_action):
         """
         Test convert endpoint returns 400 when required params are missing.
         """
-        response = api_client.get(
-            "/api/v1/exchange/rates/convert/",
+        response = call_rates_action(
+            "convert",
             {"source_currency": "USD"}
         )
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
-    def test_convert_invalid_amount(self, api_client):
+    def test_convert_invalid_amount(self, call_rates_action, currencies):
         """
         Test convert endpoint returns 400 for invalid amount.
         """
-        response = api_client.get(
-            "/api/v1/exchange/rates/convert/",
+        response = call_rates_action(
+            "convert",
             {
                 "source_currency": "USD",
                 "exchanged_currency": "EUR",
@@ -305,12 +432,12 @@ class TestCurrencyExchangeRateViewSet:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
-    def test_convert_negative_amount(self, api_client):
+    def test_convert_negative_amount(self, call_rates_action, currencies):
         """
         Test convert endpoint returns 400 for negative amount.
         """
-        response = api_client.get(
-            "/api/v1/exchange/rates/convert/",
+        response = call_rates_action(
+            "convert",
             {
                 "source_currency": "USD",
                 "exchanged_currency": "EUR",
@@ -321,18 +448,17 @@ class TestCurrencyExchangeRateViewSet:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
-    @patch('apps.exchange.api.v1.views.ExchangeRateService.convert_amount')
-    def test_convert_service_fails(self, mock_convert, api_client):
+    def test_convert_service_fails(self, mock_convert_amount, api_client, currencies):
         """
         Test convert endpoint returns 500 when service fails.
         """
-        mock_convert.return_value = None
+        mock_convert_amount.return_value = None
 
         response = api_client.get(
             "/api/v1/exchange/rates/convert/",
             {
                 "source_currency": "USD",
-                "exchanged_currency": "XXX",
+                "exchanged_currency": "GBP",
                 "amount": "100"
             }
         )
@@ -340,97 +466,49 @@ class TestCurrencyExchangeRateViewSet:
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
         assert "error" in response.data
 
-
-@pytest.mark.django_db(transaction=True)
-class TestProviderViewSet:
-    """Tests for ProviderViewSet endpoints."""
-
-    def setup_method(self):
-        """Clean up before each test."""
-        Provider.objects.all().delete()
-
-    def test_list_providers(self, api_client):
-        """
-        Test GET /api/v1/exchange/providers/ lists all providers.
-        """
-        Provider.objects.create(
-            name=ProviderName.MOCK,
-            priority=1,
-            is_active=True
-        )
-        Provider.objects.create(
-            name=ProviderName.CURRENCY_BEACON,
-            priority=2,
-            is_active=False
-        )
-
-        response = api_client.get("/api/v1/exchange/providers/")
-
-        assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
-
-    def test_retrieve_provider(self, api_client):
+    def test_convert_currency_not_found(self, mock_convert_amount, api_client, currencies):
         """
-        Test GET /api/v1/exchange/providers/{id}/ retrieves a single provider.
+        Test convert endpoint returns 404 for unknown currencies without calling the service.
         """
-        provider = Provider.objects.create(
-            name=ProviderName.MOCK,
-            priority=1,
-            is_active=True
+        response = api_client.get(
+            "/api/v1/exchange/rates/convert/",
+            {
+                "source_currency": "XXX",
+                "exchanged_currency": "YYY",
+                "amount": "100"
+            }
         )
 
-        response = api_client.get(f"/api/v1/exchange/providers/{provider.id}/")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data["error"] == "Currency not found: XXX, YYY"
+        mock_convert_amount.assert_not_called()
 
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["name"] == ProviderName.MOCK
-        assert response.data["priority"] == 1
 
-    def test_create_provider(self, api_client):
-        """
-        Test POST /api/v1/exchange/providers/ creates a new provider.
-        """
-        data = {
-            "name": ProviderName.MOCK,
-            "priority": 1,
-            "is_active": True
-        }
-        response = api_client.post("/api/v1/exchange/providers/", data)
+@pytest.mark.django_db
+class TestProviderViewSet:
+    """Tests for ProviderViewSet endpoints."""
 
-        assert response.status_code == status.HTTP_201_CREATED
-        assert Provider.objects.filter(name=ProviderName.MOCK).exists()
+    def setup_method(self):
+        """Clean up before each test."""
+        Provider.objects.all().delete()
 
-    def test_update_provider(self, api_client):
+    @pytest.mark.parametrize(
+        "method, existing, name, payload, expected_status, expected_data, expected_stored", PROVIDER_CRUD_CASES
+    )
+    def test_crud(self, api_client, method, existing, name, payload, expected_status, expected_data, expected_stored):
         """
-        Test PUT /api/v1/exchange/providers/{id}/ updates a provider.
+        Test list, retrieve, create, update and delete on /api/v1/exchange/providers/.
         """
-        provider = Provider.objects.create(
-            name=ProviderName.MOCK,
-            priority=1,
-            is_active=True
-        )
-
-        data = {
-            "name": ProviderName.MOCK,
-            "priority": 5,
-            "is_active": False
+        providers = {
+            provider_name: Provider.objects.create(name=provider_name, priority=priority, is_active=is_active)
+            for provider_name, priority, is_active in existing
         }
-        response = api_client.put(f"/api/v1/exchange/providers/{provider.id}/", data)
-
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["priority"] == 5
-        assert response.data["is_active"] is False
-
-    def test_delete_provider(self, api_client):
-        """
-        Test DELETE /api/v1/exchange/providers/{id}/ deletes a provider.
-        """
-        provider = Provider.objects.create(
-            name=ProviderName.MOCK,
-            priority=1,
-            is_active=True
-        )
+        url = "/api/v1/exchange/providers/"
+        if name is not None:
+            url += f"{providers[name].id}/"
 
-        response = api_client.delete(f"/api/v1/exchange/providers/{provider.id}/")
+        response = getattr(api_client, method)(url, payload)
 
-        assert response.status_code == status.HTTP_204_NO_CONTENT
-        assert not Provider.objects.filter(id=provider.id).exists()
+        assert response.status_code == expected_status
+        assert response_fields(response.data, PROVIDER_FIELDS) == expected_data
+        assert set(Provider.objects.values_list(*PROVIDER_FIELDS)) == expected_stored
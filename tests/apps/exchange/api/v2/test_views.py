@@ -0,0 +1,95 @@
+import pytest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from rest_framework.test import APIClient
+from rest_framework import status
+
+
+@pytest.fixture
+def api_client():
+    """DRF API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def mock_provider():
+    """ExchangeRate provider stub returned by get_exchange_rate_provider."""
+    provider = MagicMock()
+    provider.get_exchange_rate_data.return_value = Decimal("0.850000")
+    with patch('apps.exchange.api.v2.views.get_exchange_rate_provider', return_value=(provider, None)):
+        yield provider
+
+
+class TestExchangeRateV2ViewSet:
+    """Tests for ExchangeRateV2ViewSet endpoints."""
+
+    def test_convert_success(self, api_client, mock_provider):
+        """
+        Test GET /api/v2/exchange/rates/convert/ converts with the provider rate.
+        """
+        response = api_client.get(
+            "/api/v2/exchange/rates/convert/",
+            {"source_currency": "usd", "exchanged_currency": "eur", "amount": "100"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["rate"] == "0.850000"
+        assert response.data["converted_amount"] == "85.000000"
+
+    def test_convert_reuses_cached_rate(self, api_client, mock_provider):
+        """
+        Test repeated conversions for the same pair call the provider once.
+        """
+        for amount in ("100", "200"):
+            response = api_client.get(
+                "/api/v2/exchange/rates/convert/",
+                {"source_currency": "USD", "exchanged_currency": "EUR", "amount": amount}
+            )
+            assert response.status_code == status.HTTP_200_OK
+
+        assert response.data["converted_amount"] == "170.000000"
+        mock_provider.get_exchange_rate_data.assert_called_once()
+
+    def test_convert_failure_not_cached(self, api_client, mock_provider):
+        """
+        Test a failed provider call is retried on the next request.
+        """
+        mock_provider.get_exchange_rate_data.return_value = None
+
+        for _ in range(2):
+            response = api_client.get(
+                "/api/v2/exchange/rates/convert/",
+                {"source_currency": "USD", "exchanged_currency": "EUR", "amount": "100"}
+            )
+            assert response.status_code == status.HTTP_502_BAD_GATEWAY
+
+        assert mock_provider.get_exchange_rate_data.call_count == 2
+
+    @patch('apps.exchange.api.v2.views.get_exchange_rate_provider')
+    def test_convert_invalid_amount_skips_provider(self, mock_get_provider, api_client):
+        """
+        Test invalid input is rejected before the provider is acquired.
+        """
+        response = api_client.get(
+            "/api/v2/exchange/rates/convert/",
+            {"source_currency": "USD", "exchanged_currency": "EUR", "amount": "-5"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_get_provider.assert_not_called()
+
+    @patch('apps.exchange.api.v2.views.get_exchange_rate_provider')
+    def test_convert_same_currency_skips_provider(self, mock_get_provider, api_client):
+        """
+        Test an identity conversion returns rate 1 without acquiring the provider.
+        """
+        response = api_client.get(
+            "/api/v2/exchange/rates/convert/",
+            {"source_currency": "usd", "exchanged_currency": "USD", "amount": "100"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["rate"] == "1"
+        assert response.data["converted_amount"] == "100.000000"
+        mock_get_provider.assert_not_called()
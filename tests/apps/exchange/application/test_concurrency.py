@@ -0,0 +1,69 @@
+import asyncio
+
+from apps.exchange.application.concurrency import AdaptiveConcurrencyLimiter
+
+
+def test_limit_increases_on_fast_success():
+    """
+    Test that the limit grows additively after fast successful requests, up to max_limit.
+    """
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2, max_limit=3, target_latency=1.0)
+
+    async def run():
+        for _ in range(4):
+            await limiter.record(0.1, True)
+
+    asyncio.run(run())
+
+    assert limiter.limit == 3
+
+
+def test_limit_halves_on_failure():
+    """
+    Test that the limit is cut multiplicatively on failure, down to min_limit.
+    """
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2, max_limit=16, target_latency=1.0)
+    limiter.limit = 12
+
+    async def run():
+        await limiter.record(0.1, False)
+        assert limiter.limit == 6
+        await limiter.record(0.1, False)
+        await limiter.record(0.1, False)
+
+    asyncio.run(run())
+
+    assert limiter.limit == 2
+
+
+def test_slow_success_keeps_limit():
+    """
+    Test that successes above the target latency do not raise the limit.
+    """
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2, max_limit=16, target_latency=1.0)
+
+    asyncio.run(limiter.record(5.0, True))
+
+    assert limiter.limit == 2
+
+
+def test_in_flight_never_exceeds_limit():
+    """
+    Test that no more than the current limit of requests run at once.
+    """
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2, max_limit=2, target_latency=1.0)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0)
+
+    async def run():
+        await asyncio.gather(*(request() for _ in range(10)))
+
+    asyncio.run(run())
+
+    assert peak == 2
+    assert limiter.in_flight == 0
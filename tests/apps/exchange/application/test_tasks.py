@@ -1,226 +1,200 @@
-import pytest
+import asyncio
+import uuid
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
 from datetime import date, timedelta
-from unittest.mock import patch, MagicMock
 
+from apps.exchange.application.concurrency import AdaptiveConcurrencyLimiter
 from apps.exchange.application.tasks import (
-    sync_exchange_rates_for_today,
-    cleanup_old_exchange_rates,
-    check_providers_health,
-    sync_missing_rates_for_currency_pair
+    aggregate_historical_results,
+    build_rate_rows,
+    dispatch_historical_load,
+    fetch_rates_async,
+    load_historical_data,
+    split_date_range,
 )
-from apps.exchange.infrastructure.persistence.models import (
-    Currency,
-    CurrencyExchangeRate,
-    Provider,
-    ProviderName
-)
-
-
-@pytest.mark.django_db(transaction=True)
-class TestCeleryTasks:
-    """Tests for Celery background tasks."""
-
-    def setup_method(self):
-        """Clean up before each test."""
-        CurrencyExchangeRate.objects.all().delete()
-        Currency.objects.all().delete()
-        Provider.objects.all().delete()
-
-    def test_sync_exchange_rates_no_currencies(self):
-        """Test sync task when no currencies exist."""
-        result = sync_exchange_rates_for_today()
-
-        assert result["success"] is False
-        assert "No currencies" in result["message"]
-        assert result["rates_synced"] == 0
-
-    def test_sync_exchange_rates_no_providers(self):
-        """Test sync task when no providers are active."""
-        Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-        Currency.objects.create(code="EUR", name="Euro", symbol="€")
-
-        result = sync_exchange_rates_for_today()
-
-        assert result["success"] is False
-        assert "No active providers" in result["message"]
-
-    @patch('apps.exchange.application.tasks.get_provider_instance')
-    def test_sync_exchange_rates_success(self, mock_get_provider):
-        """Test successful rate synchronization."""
-        # Setup currencies and provider
-        Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-        Currency.objects.create(code="EUR", name="Euro", symbol="€")
-        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
-
-        # Mock provider instance
-        mock_provider = MagicMock()
-        mock_provider.get_exchange_rate_data.return_value = Decimal("0.85")
-        mock_get_provider.return_value = mock_provider
-
-        result = sync_exchange_rates_for_today()
-
-        assert result["success"] is True
-        assert result["rates_synced"] > 0
-
-    @patch('apps.exchange.application.tasks.get_provider_instance')
-    def test_sync_exchange_rates_skips_existing(self, mock_get_provider):
-        """Test that sync skips rates that already exist."""
-        # Setup
-        usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-        eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
-        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
-
-        # Create existing rate for USD->EUR
-        today = date.today()
-        CurrencyExchangeRate.objects.create(
-            source_currency=usd,
-            exchanged_currency=eur,
-            valuation_date=today,
-            rate_value=Decimal("0.85")
-        )
-
-        # Mock provider
-        mock_provider = MagicMock()
-        mock_provider.get_exchange_rate_data.return_value = Decimal("0.86")
-        mock_get_provider.return_value = mock_provider
-
-        result = sync_exchange_rates_for_today()
-
-        # Should not duplicate USD->EUR, but should create EUR->USD
-        # Total should be 2: existing USD->EUR + new EUR->USD
-        assert CurrencyExchangeRate.objects.count() == 2
-
-        # Verify the existing rate wasn't modified
-        existing_rate = CurrencyExchangeRate.objects.get(
-            source_currency=usd,
-            exchanged_currency=eur
-        )
-        assert existing_rate.rate_value == Decimal("0.85")
-
-    def test_cleanup_old_exchange_rates(self):
-        """Test cleanup of old exchange rates."""
-        # Setup
-        usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-        eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
-
-        # Create old and recent rates
-        old_date = date.today() - timedelta(days=100)
-        recent_date = date.today() - timedelta(days=10)
-
-        CurrencyExchangeRate.objects.create(
-            source_currency=usd,
-            exchanged_currency=eur,
-            valuation_date=old_date,
-            rate_value=Decimal("0.85")
-        )
-        CurrencyExchangeRate.objects.create(
-            source_currency=usd,
-            exchanged_currency=eur,
-            valuation_date=recent_date,
-            rate_value=Decimal("0.86")
-        )
-
-        result = cleanup_old_exchange_rates(days_to_keep=90)
-
-        assert result["success"] is True
-        assert result["rates_deleted"] == 1
-        assert CurrencyExchangeRate.objects.count() == 1
-
-    @patch('apps.exchange.application.tasks.get_provider_instance')
-    def test_check_providers_health_all_healthy(self, mock_get_provider):
-        """Test provider health check when all providers are healthy."""
-        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
-
-        # Mock healthy provider
-        mock_provider = MagicMock()
-        mock_provider.get_exchange_rate_data.return_value = Decimal("0.85")
-        mock_get_provider.return_value = mock_provider
-
-        result = check_providers_health()
-
-        assert result["success"] is True
-        assert result["providers_checked"] == 1
-        assert result["results"][ProviderName.MOCK]["status"] == "healthy"
-
-    @patch('apps.exchange.application.tasks.get_provider_instance')
-    def test_check_providers_health_unhealthy(self, mock_get_provider):
-        """Test provider health check with unhealthy provider."""
-        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
-
-        # Mock unhealthy provider
-        mock_provider = MagicMock()
-        mock_provider.get_exchange_rate_data.return_value = None
-        mock_get_provider.return_value = mock_provider
-
-        result = check_providers_health()
-
-        assert result["success"] is True
-        assert result["results"][ProviderName.MOCK]["status"] == "unhealthy"
-
-    @patch('apps.exchange.application.tasks.get_provider_instance')
-    def test_check_providers_health_error(self, mock_get_provider):
-        """Test provider health check when provider raises error."""
-        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
-
-        # Mock provider that raises error
-        mock_provider = MagicMock()
-        mock_provider.get_exchange_rate_data.side_effect = Exception("API Error")
-        mock_get_provider.return_value = mock_provider
-
-        result = check_providers_health()
-
-        assert result["success"] is True
-        assert result["results"][ProviderName.MOCK]["status"] == "error"
-        assert "API Error" in result["results"][ProviderName.MOCK]["message"]
-
-    @patch('apps.exchange.application.tasks.get_provider_instance')
-    def test_sync_missing_rates_for_currency_pair(self, mock_get_provider):
-        """Test syncing missing rates for specific currency pair."""
-        # Setup
-        usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-        eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
-        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
-
-        # Mock provider
-        mock_provider = MagicMock()
-        mock_provider.get_exchange_rate_data.return_value = Decimal("0.85")
-        mock_get_provider.return_value = mock_provider
-
-        date_from = date(2024, 5, 21)
-        date_to = date(2024, 5, 23)
-
-        result = sync_missing_rates_for_currency_pair(
-            "USD",
-            "EUR",
-            date_from.isoformat(),
-            date_to.isoformat()
-        )
-
-        assert result["success"] is True
-        assert result["rates_synced"] == 3  # 3 days
-        assert result["currency_pair"] == "USD/EUR"
-
-    def test_sync_missing_rates_invalid_date(self):
-        """Test sync with invalid date format."""
-        result = sync_missing_rates_for_currency_pair(
-            "USD",
-            "EUR",
-            "invalid-date",
-            "2024-05-23"
-        )
-
-        assert result["success"] is False
-        assert "Invalid date format" in result["message"]
-
-    def test_sync_missing_rates_currency_not_found(self):
-        """Test sync when currency doesn't exist."""
-        result = sync_missing_rates_for_currency_pair(
-            "XXX",
-            "YYY",
-            "2024-05-21",
-            "2024-05-23"
-        )
-
-        assert result["success"] is False
-        assert "Currency not found" in result["message"]
+from apps.exchange.domain.interfaces import BaseExchangeRateProvider
+from apps.exchange.infrastructure.persistence.models import Currency, CurrencyExchangeRate
+from apps.exchange.infrastructure.providers.mock import MockProvider
+from core.settings import HISTORICAL_LOAD_CHUNK_DAYS
+
+
+# Shared test values, built once per module
+DATE_FROM = date(2024, 1, 1)
+
+
+@pytest.mark.parametrize("days, chunk_days, expected", [
+    # A single day is a single chunk
+    (1, 30, [(DATE_FROM, DATE_FROM)]),
+    # Exactly two chunks: no empty or one-day chunk at the end
+    (60, 30, [(date(2024, 1, 1), date(2024, 1, 30)), (date(2024, 1, 31), date(2024, 2, 29))]),
+    # One day over: the last chunk holds just that day
+    (61, 30, [
+        (date(2024, 1, 1), date(2024, 1, 30)),
+        (date(2024, 1, 31), date(2024, 2, 29)),
+        (date(2024, 3, 1), date(2024, 3, 1)),
+    ]),
+    # Range shorter than a chunk
+    (10, 30, [(date(2024, 1, 1), date(2024, 1, 10))]),
+])
+def test_split_date_range_boundaries(days, chunk_days, expected):
+    """
+    Test that split_date_range covers the range with consecutive chunks of at
+    most chunk_days days, both ends included.
+    """
+    date_to = DATE_FROM + timedelta(days=days - 1)
+
+    assert split_date_range(DATE_FROM, date_to, chunk_days) == expected
+
+
+def test_split_date_range_multiple_of_configured_chunk():
+    """
+    Test that a range of exactly N x HISTORICAL_LOAD_CHUNK_DAYS days gives N
+    full, contiguous chunks.
+    """
+    date_to = DATE_FROM + timedelta(days=3 * HISTORICAL_LOAD_CHUNK_DAYS - 1)
+
+    chunks = split_date_range(DATE_FROM, date_to, HISTORICAL_LOAD_CHUNK_DAYS)
+
+    assert len(chunks) == 3
+    assert chunks[0][0] == DATE_FROM
+    assert chunks[-1][1] == date_to
+    for chunk_from, chunk_to in chunks:
+        assert (chunk_to - chunk_from).days + 1 == HISTORICAL_LOAD_CHUNK_DAYS
+    for (_, previous_to), (next_from, _) in zip(chunks, chunks[1:]):
+        assert next_from == previous_to + timedelta(days=1)
+
+
+def test_aggregate_historical_results_merges_subtasks():
+    """
+    Test that the chord callback sums loaded rates, and reports failed
+    subtasks and their errors.
+    """
+    results = [
+        {"success": True, "rates_loaded": 10, "errors": ["No rates fetched for 2024-01-02"]},
+        {"success": False, "message": "No active provider found.", "rates_loaded": 0},
+        {"success": True, "rates_loaded": 5, "errors": []},
+    ]
+
+    aggregate = aggregate_historical_results(results, "2024-01-01", "2024-03-01")
+
+    assert aggregate == {
+        "success": False,
+        "rates_loaded": 15,
+        "date_from": "2024-01-01",
+        "date_to": "2024-03-01",
+        "errors": ["No rates fetched for 2024-01-02", "No active provider found."],
+    }
+
+
+def test_aggregate_historical_results_all_successful():
+    """
+    Test that the aggregate succeeds when every subtask did.
+    """
+    results = [
+        {"success": True, "rates_loaded": 3, "errors": []},
+        {"success": True, "rates_loaded": 4, "errors": []},
+    ]
+
+    aggregate = aggregate_historical_results(results, "2024-01-01", "2024-01-31")
+
+    assert aggregate["success"] is True
+    assert aggregate["rates_loaded"] == 7
+    assert aggregate["errors"] == []
+
+
+def test_dispatch_historical_load_builds_chord(mocker):
+    """
+    Test that dispatch_historical_load sends one load_historical_data subtask
+    per chunk, with aggregate_historical_results as the callback.
+    """
+    mock_chord = mocker.patch("apps.exchange.application.tasks.chord")
+    date_to = DATE_FROM + timedelta(days=HISTORICAL_LOAD_CHUNK_DAYS)
+
+    result = dispatch_historical_load(DATE_FROM, date_to)
+
+    subtasks = mock_chord.call_args[0][0]
+    assert [subtask.task for subtask in subtasks] == ["load_historical_data"] * 2
+    assert [subtask.args for subtask in subtasks] == [
+        (chunk_from.isoformat(), chunk_to.isoformat())
+        for chunk_from, chunk_to in split_date_range(DATE_FROM, date_to, HISTORICAL_LOAD_CHUNK_DAYS)
+    ]
+
+    callback = mock_chord.return_value.call_args[0][0]
+    assert callback.task == "aggregate_historical_results"
+    assert callback.args == (DATE_FROM.isoformat(), date_to.isoformat())
+    assert result is mock_chord.return_value.return_value
+
+
+def test_fetch_rates_async_records_raised_request_as_failure():
+    """
+    Test that a provider call that raises is reported to the limiter as a
+    failure, so the limit backs off, and the exception still propagates.
+    """
+    provider = MagicMock(spec=BaseExchangeRateProvider)
+    provider.get_exchange_rates_bulk_async.side_effect = RuntimeError("down")
+    limiter = AdaptiveConcurrencyLimiter(min_limit=2, max_limit=16, target_latency=1.0)
+    limiter.limit = 12
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(fetch_rates_async(provider, "USD", ["EUR"], DATE_FROM, limiter))
+
+    assert limiter.limit == 6
+    assert limiter.in_flight == 0
+
+
+def test_build_rate_rows_derives_inverse_and_skips_unknown_codes():
+    """
+    Test that build_rate_rows adds the inverse of each fetched rate and drops
+    rates whose currencies have no id.
+    """
+    code_to_id = {"USD": uuid.uuid4(), "EUR": uuid.uuid4()}
+    results = [
+        ("USD", "EUR", DATE_FROM, Decimal("0.8")),
+        ("USD", "XXX", DATE_FROM, Decimal("2")),
+    ]
+
+    rows = build_rate_rows(results, code_to_id)
+
+    assert rows == [
+        {
+            "source_currency_id": code_to_id["USD"],
+            "exchanged_currency_id": code_to_id["EUR"],
+            "valuation_date": DATE_FROM,
+            "rate_value": Decimal("0.8"),
+        },
+        {
+            "source_currency_id": code_to_id["EUR"],
+            "exchanged_currency_id": code_to_id["USD"],
+            "valuation_date": DATE_FROM,
+            "rate_value": Decimal("1.250000"),
+        },
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("process_workers", [0, 2])
+def test_load_historical_data_builds_rows(mocker, currencies, process_workers):
+    """
+    Test that load_historical_data stores both directions of every pair for
+    each day, building rows in process or in a process pool.
+    """
+    mocker.patch("apps.exchange.application.tasks.get_top_priority_provider", return_value=MockProvider())
+    mocker.patch("apps.exchange.application.tasks.HISTORICAL_LOAD_PROCESS_WORKERS", process_workers)
+    mock_pool = mocker.patch("apps.exchange.application.tasks.ProcessPoolExecutor", wraps=ProcessPoolExecutor)
+    supported_codes = set(MockProvider.BASE_RATES)
+    Currency.objects.exclude(code__in=supported_codes).delete()
+    currency_count = Currency.objects.count()
+
+    result = load_historical_data("2024-05-21", "2024-05-22")
+
+    expected_count = 2 * currency_count * (currency_count - 1)
+    assert result["success"] is True
+    assert result["rates_loaded"] == expected_count
+    assert CurrencyExchangeRate.objects.filter(
+        valuation_date__range=(date(2024, 5, 21), date(2024, 5, 22))
+    ).count() == expected_count
+    assert mock_pool.called is bool(process_workers)
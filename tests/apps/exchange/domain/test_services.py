@@ -3,49 +3,28 @@ from decimal import Decimal
 from datetime import date
 from unittest.mock import patch, MagicMock
 
-from apps.exchange.domain.services import ExchangeRateService
-from apps.exchange.infrastructure.persistence.models import Currency, CurrencyExchangeRate, Provider, ProviderName
-from apps.exchange.infrastructure.providers.mock import MockProvider
+from apps.exchange.domain.interfaces import BaseExchangeRateProvider
+from apps.exchange.domain.services import QUANTUM, ExchangeRateService, convert_scaled, date_runs, daterange
+from apps.exchange.infrastructure.persistence.models import CurrencyExchangeRate
+from apps.exchange.infrastructure.persistence.repositories import CurrencyRepository
 
+# Shared test values, built once per module
+USD_EUR_RATE = Decimal("0.850000")
+PROVIDER_RATE = Decimal("0.85")
+AMOUNT = Decimal("100")
 
-@pytest.fixture
-def currencies(db):
-    """Create test currencies."""
-    Currency.objects.all().delete()
-    usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-    eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
-    gbp = Currency.objects.create(code="GBP", name="British Pound", symbol="£")
-    return {"USD": usd, "EUR": eur, "GBP": gbp}
 
-
-@pytest.fixture
-def mock_provider_active(db):
-    """Create active mock provider in DB."""
-    Provider.objects.all().delete()
-    return Provider.objects.create(
-        name=ProviderName.MOCK,
-        priority=1,
-        is_active=True
-    )
-
-
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestExchangeRateService:
     """Tests for ExchangeRateService domain service."""
 
-    def setup_method(self):
-        """Clean up before each test."""
-        CurrencyExchangeRate.objects.all().delete()
-        Currency.objects.all().delete()
-        Provider.objects.all().delete()
-
     def test_get_exchange_rate_from_database(self, currencies):
         """
         Test that get_exchange_rate returns rate from database when it exists.
         """
         # Create existing rate in DB
         test_date = date(2024, 5, 21)
-        rate_value = Decimal("0.850000")
+        rate_value = USD_EUR_RATE
 
         CurrencyExchangeRate.objects.create(
             source_currency=currencies["USD"],
@@ -58,6 +37,77 @@ class TestExchangeRateService:
 
         assert result == rate_value
 
+    def test_get_exchange_rate_from_database_single_query(self, currencies, django_assert_num_queries):
+        """
+        Test that a stored rate is read with one query once currencies are cached.
+        """
+        test_date = date(2024, 5, 21)
+        CurrencyExchangeRate.objects.create(
+            source_currency=currencies["USD"],
+            exchanged_currency=currencies["EUR"],
+            valuation_date=test_date,
+            rate_value=USD_EUR_RATE
+        )
+        CurrencyRepository.get_code_map()
+
+        with django_assert_num_queries(1):
+            result = ExchangeRateService.get_exchange_rate("USD", "EUR", test_date)
+
+        assert result == USD_EUR_RATE
+
+    @patch('apps.exchange.domain.services.get_active_providers_ordered')
+    def test_get_exchange_rate_inverts_reverse_pair(self, mock_get_providers, currencies):
+        """
+        Test that a stored reverse rate is inverted instead of querying providers.
+        """
+        test_date = date(2024, 5, 21)
+
+        CurrencyExchangeRate.objects.create(
+            source_currency=currencies["EUR"],
+            exchanged_currency=currencies["USD"],
+            valuation_date=test_date,
+            rate_value=Decimal("1.250000")
+        )
+
+        result = ExchangeRateService.get_exchange_rate("USD", "EUR", test_date)
+
+        assert result == Decimal("0.800000")
+        mock_get_providers.assert_not_called()
+
+    @patch('apps.exchange.domain.services.ExchangeRateService.fetch_rate_from_providers')
+    def test_get_exchange_rate_normalizes_codes(self, mock_fetch, currencies):
+        """
+        Test that lowercase codes reach the providers uppercased.
+        """
+        test_date = date(2024, 5, 21)
+        mock_fetch.return_value = PROVIDER_RATE
+
+        result = ExchangeRateService.get_exchange_rate("usd", "eur", test_date)
+
+        assert result == PROVIDER_RATE
+        mock_fetch.assert_called_once_with("USD", "EUR", test_date)
+
+    @patch('apps.exchange.domain.services.ExchangeRateService.fetch_rate_from_providers')
+    def test_get_exchange_rate_large_reverse_rate_uses_providers(self, mock_fetch, currencies):
+        """
+        Test that a stored reverse rate too large to invert precisely is not
+        used, and the direct rate comes from the providers.
+        """
+        test_date = date(2024, 5, 21)
+        mock_fetch.return_value = Decimal("0.000063")
+
+        CurrencyExchangeRate.objects.create(
+            source_currency=currencies["EUR"],
+            exchanged_currency=currencies["USD"],
+            valuation_date=test_date,
+            rate_value=Decimal("16000.000000")
+        )
+
+        result = ExchangeRateService.get_exchange_rate("USD", "EUR", test_date)
+
+        assert result == Decimal("0.000063")
+        mock_fetch.assert_called_once_with("USD", "EUR", test_date)
+
     def test_get_exchange_rate_currency_not_found(self, db):
         """
         Test that get_exchange_rate returns None when currency doesn't exist.
@@ -68,6 +118,29 @@ class TestExchangeRateService:
 
         assert result is None
 
+    def test_get_exchange_rate_invalid_code(self, currencies, django_assert_num_queries):
+        """
+        Test that get_exchange_rate rejects codes that are not 3 letters without any lookup.
+        """
+        with django_assert_num_queries(0):
+            result = ExchangeRateService.get_exchange_rate("USDX", "EUR", date(2024, 5, 21))
+
+        assert result is None
+
+    @patch('apps.exchange.domain.services.get_active_providers_ordered')
+    def test_get_exchange_rate_same_currency(self, mock_get_providers, currencies, django_assert_num_queries):
+        """
+        Test that get_exchange_rate returns 1 for identical currencies without any lookup.
+        """
+        CurrencyRepository.get_code_map()
+
+        with django_assert_num_queries(0):
+            result = ExchangeRateService.get_exchange_rate("USD", "USD", date(2024, 5, 21))
+
+        assert result == Decimal("1")
+        mock_get_providers.assert_not_called()
+        assert not CurrencyExchangeRate.objects.exists()
+
     @patch('apps.exchange.domain.services.get_active_providers_ordered')
     def test_get_exchange_rate_no_providers(self, mock_get_providers, currencies):
         """
@@ -86,16 +159,38 @@ class TestExchangeRateService:
         Test that get_exchange_rate fetches from provider when not in DB.
         """
         # Setup mock provider
-        mock_provider = MockProvider()
+        mock_provider = MagicMock(spec=BaseExchangeRateProvider)
+        mock_provider.get_exchange_rate_data.return_value = PROVIDER_RATE
         mock_get_providers.return_value = [mock_provider]
 
         test_date = date(2024, 5, 21)
 
         result = ExchangeRateService.get_exchange_rate("USD", "EUR", test_date)
 
-        assert result is not None
-        assert isinstance(result, Decimal)
-        assert result > 0
+        assert result == PROVIDER_RATE
+        mock_provider.get_exchange_rate_data.assert_called_once_with("USD", "EUR", test_date)
+
+    @patch('apps.exchange.domain.services.ExchangeRateService._lookup_directional', return_value=None)
+    @patch('apps.exchange.domain.services.get_active_providers_ordered')
+    def test_get_exchange_rate_concurrent_save(self, mock_get_providers, mock_lookup, currencies):
+        """
+        Test that a rate stored concurrently after the lookup is kept, not duplicated.
+        """
+        mock_provider = MagicMock()
+        mock_provider.get_exchange_rate_data.return_value = Decimal("0.900000")
+        mock_get_providers.return_value = [mock_provider]
+        test_date = date(2024, 5, 21)
+        CurrencyExchangeRate.objects.create(
+            source_currency=currencies["USD"],
+            exchanged_currency=currencies["EUR"],
+            valuation_date=test_date,
+            rate_value=USD_EUR_RATE
+        )
+
+        result = ExchangeRateService.get_exchange_rate("USD", "EUR", test_date)
+
+        assert result == Decimal("0.900000")
+        assert CurrencyExchangeRate.objects.get(valuation_date=test_date).rate_value == USD_EUR_RATE
 
     @patch('apps.exchange.domain.services.get_active_providers_ordered')
     def test_get_exchange_rate_saves_to_database(self, mock_get_providers, currencies, mock_provider_active):
@@ -103,7 +198,8 @@ class TestExchangeRateService:
         Test that get_exchange_rate saves fetched rate to database.
         """
         # Setup mock provider
-        mock_provider = MockProvider()
+        mock_provider = MagicMock(spec=BaseExchangeRateProvider)
+        mock_provider.get_exchange_rate_data.return_value = PROVIDER_RATE
         mock_get_providers.return_value = [mock_provider]
 
         test_date = date(2024, 5, 21)
@@ -135,7 +231,8 @@ class TestExchangeRateService:
         failing_provider = MagicMock()
         failing_provider.get_exchange_rate_data.return_value = None
 
-        successful_provider = MockProvider()
+        successful_provider = MagicMock(spec=BaseExchangeRateProvider)
+        successful_provider.get_exchange_rate_data.return_value = PROVIDER_RATE
 
         mock_get_providers.return_value = [failing_provider, successful_provider]
 
@@ -143,8 +240,7 @@ class TestExchangeRateService:
 
         result = ExchangeRateService.get_exchange_rate("USD", "EUR", test_date)
 
-        assert result is not None
-        assert isinstance(result, Decimal)
+        assert result == PROVIDER_RATE
         # Verify first provider was called
         failing_provider.get_exchange_rate_data.assert_called_once()
 
@@ -170,8 +266,8 @@ class TestExchangeRateService:
         """
         Test convert_amount with successful rate retrieval.
         """
-        mock_get_rate.return_value = Decimal("0.850000")
-        amount = Decimal("100")
+        mock_get_rate.return_value = USD_EUR_RATE
+        amount = AMOUNT
         test_date = date(2024, 5, 21)
 
         result = ExchangeRateService.convert_amount("USD", "EUR", amount, test_date)
@@ -180,7 +276,7 @@ class TestExchangeRateService:
         assert result["source_currency"] == "USD"
         assert result["exchanged_currency"] == "EUR"
         assert result["amount"] == amount
-        assert result["rate"] == Decimal("0.850000")
+        assert result["rate"] == USD_EUR_RATE
         assert result["converted_amount"] == Decimal("85.000000")
         assert result["valuation_date"] == test_date
 
@@ -190,7 +286,7 @@ class TestExchangeRateService:
         Test convert_amount returns None when rate cannot be retrieved.
         """
         mock_get_rate.return_value = None
-        amount = Decimal("100")
+        amount = AMOUNT
 
         result = ExchangeRateService.convert_amount("USD", "XXX", amount)
 
@@ -201,8 +297,8 @@ class TestExchangeRateService:
         """
         Test convert_amount uses today's date when valuation_date is None.
         """
-        mock_get_rate.return_value = Decimal("0.850000")
-        amount = Decimal("100")
+        mock_get_rate.return_value = USD_EUR_RATE
+        amount = AMOUNT
 
         result = ExchangeRateService.convert_amount("USD", "EUR", amount)
 
@@ -215,7 +311,7 @@ class TestExchangeRateService:
         Test convert_amount maintains 6 decimal places precision.
         """
         mock_get_rate.return_value = Decimal("1.234567")
-        amount = Decimal("100")
+        amount = AMOUNT
 
         result = ExchangeRateService.convert_amount("USD", "EUR", amount)
 
@@ -224,3 +320,208 @@ class TestExchangeRateService:
         assert str(result["converted_amount"]).count(".") == 1
         decimal_places = len(str(result["converted_amount"]).split(".")[1])
         assert decimal_places <= 6
+
+    def test_convert_amounts_bulk_from_database(self, currencies):
+        """
+        Test convert_amounts_bulk reads stored rates for all targets at once.
+        """
+        test_date = date(2024, 5, 21)
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=test_date,
+                rate_value=USD_EUR_RATE
+            ),
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["GBP"],
+                valuation_date=test_date,
+                rate_value=Decimal("0.730000")
+            )
+        ])
+
+        with patch('apps.exchange.domain.services.ExchangeRateService.get_exchange_rate') as mock_get_rate:
+            results = ExchangeRateService.convert_amounts_bulk("USD", ["EUR", "GBP"], AMOUNT, test_date)
+
+        mock_get_rate.assert_not_called()
+        assert [r["exchanged_currency"] for r in results] == ["EUR", "GBP"]
+        assert results[0]["converted_amount"] == Decimal("85.000000")
+        assert results[1]["converted_amount"] == Decimal("73.000000")
+
+    @patch('apps.exchange.domain.services.ExchangeRateService.get_exchange_rate')
+    def test_convert_amounts_bulk_missing_rates(self, mock_get_rate, currencies):
+        """
+        Test convert_amounts_bulk falls back once per missing target and keeps failures aligned.
+        Unknown currencies fail without reaching the provider chain.
+        """
+        mock_get_rate.side_effect = lambda source, target, valuation_date: (
+            USD_EUR_RATE if target == "EUR" else None
+        )
+        test_date = date(2024, 5, 21)
+
+        results = ExchangeRateService.convert_amounts_bulk("USD", ["EUR", "XXX", "EUR"], AMOUNT, test_date)
+
+        mock_get_rate.assert_called_once_with("USD", "EUR", test_date)
+        assert results[0]["converted_amount"] == Decimal("85.000000")
+        assert results[1] is None
+        assert results[2]["converted_amount"] == Decimal("85.000000")
+
+    @patch('apps.exchange.domain.services.get_active_providers_ordered')
+    def test_get_rates_for_range_backfills_missing(self, mock_get_providers, currencies):
+        """
+        Test get_rates_for_range only fetches missing points and saves them in bulk.
+        """
+        provider = MagicMock(spec=BaseExchangeRateProvider)
+        provider.get_exchange_rates_timeseries.return_value = {date(2024, 5, 22): {"EUR": Decimal("0.900000")}}
+        mock_get_providers.return_value = (provider,)
+        CurrencyExchangeRate.objects.create(
+            source_currency=currencies["USD"],
+            exchanged_currency=currencies["EUR"],
+            valuation_date=date(2024, 5, 21),
+            rate_value=USD_EUR_RATE
+        )
+
+        rates = ExchangeRateService.get_rates_for_range(
+            "USD", ["EUR", "USD", "XXX"], date(2024, 5, 21), date(2024, 5, 22)
+        )
+
+        provider.get_exchange_rates_timeseries.assert_called_once_with(
+            "USD", ["EUR"], date(2024, 5, 22), date(2024, 5, 22)
+        )
+        assert rates == {
+            ("EUR", date(2024, 5, 21)): USD_EUR_RATE,
+            ("EUR", date(2024, 5, 22)): Decimal("0.900000"),
+        }
+        assert CurrencyExchangeRate.objects.filter(
+            source_currency=currencies["USD"],
+            valuation_date=date(2024, 5, 22)
+        ).count() == 1
+
+    @patch('apps.exchange.domain.services.get_active_providers_ordered')
+    def test_get_rates_for_range_falls_back_for_remaining_points(self, mock_get_providers, currencies):
+        """
+        Test that points the first provider cannot supply are requested from the
+        next one, over the range that is still missing.
+        """
+        primary = MagicMock(spec=BaseExchangeRateProvider)
+        primary.get_exchange_rates_timeseries.return_value = {
+            date(2024, 5, 21): {"EUR": USD_EUR_RATE, "GBP": Decimal("0.730000")},
+            date(2024, 5, 22): {"EUR": USD_EUR_RATE},
+        }
+        secondary = MagicMock(spec=BaseExchangeRateProvider)
+        secondary.get_exchange_rates_timeseries.return_value = {date(2024, 5, 22): {"GBP": Decimal("0.740000")}}
+        mock_get_providers.return_value = (primary, secondary)
+
+        rates = ExchangeRateService.get_rates_for_range("USD", ["EUR", "GBP"], date(2024, 5, 21), date(2024, 5, 22))
+
+        primary.get_exchange_rates_timeseries.assert_called_once_with(
+            "USD", ["EUR", "GBP"], date(2024, 5, 21), date(2024, 5, 22)
+        )
+        secondary.get_exchange_rates_timeseries.assert_called_once_with(
+            "USD", ["GBP"], date(2024, 5, 22), date(2024, 5, 22)
+        )
+        assert rates[("GBP", date(2024, 5, 22))] == Decimal("0.740000")
+        assert len(rates) == 4
+
+    @patch('apps.exchange.domain.services.get_active_providers_ordered')
+    def test_get_rates_for_range_constant_queries(
+        self, mock_get_providers, currencies, django_assert_num_queries
+    ):
+        """
+        Test backfilling a month issues the same statements as a single day:
+        one read of the stored dates and one bulk insert of the missing ones.
+        """
+        provider = MagicMock(spec=BaseExchangeRateProvider)
+        provider.get_exchange_rates_timeseries.return_value = {
+            day: {"EUR": Decimal("0.900000")} for day in daterange(date(2024, 5, 1), date(2024, 5, 30))
+        }
+        mock_get_providers.return_value = (provider,)
+        CurrencyRepository.get_code_map()
+
+        with django_assert_num_queries(2):
+            ExchangeRateService.get_rates_for_range("USD", ["EUR"], date(2024, 5, 1), date(2024, 5, 30))
+
+        assert set(
+            CurrencyExchangeRate.objects.filter(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"]
+            ).values_list("valuation_date", flat=True)
+        ) == set(daterange(date(2024, 5, 1), date(2024, 5, 30)))
+
+    @patch('apps.exchange.domain.services.get_active_providers_ordered')
+    def test_get_rates_for_range_fetches_only_missing_runs(self, mock_get_providers, currencies):
+        """
+        Test that two gaps far apart in the range cost one provider call each,
+        with a provider falling back to the per-day time series, instead of a
+        call for every day between them.
+        """
+        class DailyProvider(BaseExchangeRateProvider):
+            def __init__(self):
+                self.calls = []
+
+            def get_exchange_rate_data(self, source_currency, exchanged_currency, date):
+                self.calls.append((exchanged_currency, date))
+                return Decimal("0.900000")
+
+        provider = DailyProvider()
+        mock_get_providers.return_value = (provider,)
+        date_from, date_to = date(2024, 1, 1), date(2024, 12, 31)
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=day,
+                rate_value=USD_EUR_RATE
+            )
+            for day in daterange(date(2024, 1, 2), date(2024, 12, 30))
+        ])
+
+        rates = ExchangeRateService.get_rates_for_range("USD", ["EUR"], date_from, date_to)
+
+        assert provider.calls == [("EUR", date_from), ("EUR", date_to)]
+        assert rates[("EUR", date_from)] == rates[("EUR", date_to)] == Decimal("0.900000")
+        assert len(rates) == 366
+
+
+def test_date_runs_groups_consecutive_days():
+    """
+    Test date_runs merges consecutive days into ordered (first, last) runs.
+    """
+    dates = [date(2024, 3, 1), date(2024, 2, 28), date(2024, 2, 29), date(2024, 6, 1), date(2024, 3, 1)]
+
+    assert date_runs(dates) == [(date(2024, 2, 28), date(2024, 3, 1)), (date(2024, 6, 1), date(2024, 6, 1))]
+    assert date_runs([]) == []
+
+
+def test_daterange_includes_both_ends():
+    """
+    Test daterange yields every day of the range, both ends included.
+    """
+    assert list(daterange(date(2024, 2, 28), date(2024, 3, 1))) == [
+        date(2024, 2, 28), date(2024, 2, 29), date(2024, 3, 1)
+    ]
+    assert list(daterange(date(2024, 3, 1), date(2024, 2, 28))) == []
+
+
+@pytest.mark.parametrize(
+    "amount, rate",
+    [
+        ("100", "0.850000"),
+        ("0.000001", "0.5"),
+        ("0.000003", "0.5"),
+        ("12345.678901", "1.234567"),
+        ("1E+3", "0.85"),
+        ("1.123456789", "0.85"),
+        ("-2.5", "0.000001"),
+    ],
+)
+def test_convert_scaled_matches_decimal(amount, rate):
+    """
+    Test the integer conversion path gives exactly the quantized Decimal result.
+    """
+    result = convert_scaled(Decimal(amount), Decimal(rate))
+    expected = (Decimal(amount) * Decimal(rate)).quantize(QUANTUM)
+
+    assert result == expected
+    assert str(result) == str(expected)
@@ -1,6 +1,7 @@
 import pytest
 from decimal import Decimal
-from datetime import date, timedelta
+from datetime import date, datetime, timezone as dt_timezone
+from unittest.mock import patch
 
 from apps.exchange.infrastructure.persistence.repositories import (
     CurrencyRepository,
@@ -15,7 +16,22 @@ from apps.exchange.infrastructure.persistence.models import (
 )
 
 
-@pytest.mark.django_db(transaction=True)
+# Shared test values, built once per module
+USD_EUR_RATE = Decimal("0.85")
+NEXT_DAY_RATE = Decimal("0.86")
+UPDATED_RATE = Decimal("0.90")
+
+# Fixed clock for the retention tests
+FROZEN_NOW = datetime(2024, 5, 21, 12, tzinfo=dt_timezone.utc)
+
+
+@pytest.fixture
+def frozen_now(mocker):
+    """Pin django.utils.timezone.now() to FROZEN_NOW so date cutoffs are constant."""
+    return mocker.patch("django.utils.timezone.now", return_value=FROZEN_NOW)
+
+
+@pytest.mark.django_db
 class TestCurrencyRepository:
     """Tests for CurrencyRepository."""
 
@@ -47,6 +63,41 @@ class TestCurrencyRepository:
 
         assert currency is None
 
+    def test_get_by_code_cached(self, django_assert_num_queries):
+        """Test get_by_code serves repeated lookups from cache."""
+        Currency.objects.create(code="USD", name="US Dollar", symbol="$")
+        CurrencyRepository.get_by_code("USD")
+
+        with django_assert_num_queries(0):
+            currency = CurrencyRepository.get_by_code("USD")
+
+        assert currency.code == "USD"
+
+    def test_get_by_code_cache_invalidated_on_save(self):
+        """Test currency changes are visible through get_by_code."""
+        currency = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
+        assert CurrencyRepository.get_by_code("EUR") is None
+
+        Currency.objects.create(code="EUR", name="Euro", symbol="€")
+        currency.name = "United States Dollar"
+        currency.save()
+
+        assert CurrencyRepository.get_by_code("EUR") is not None
+        assert CurrencyRepository.get_by_code("USD").name == "United States Dollar"
+
+    def test_get_missing_codes(self):
+        """Test get_missing_codes returns only unknown codes."""
+        Currency.objects.create(code="USD", name="US Dollar", symbol="$")
+
+        assert CurrencyRepository.get_missing_codes(["usd", "EUR"]) == {"EUR"}
+        assert CurrencyRepository.get_missing_codes(["USD"]) == set()
+
+    def test_get_by_codes(self):
+        """Test get_by_codes resolves known codes and skips unknown ones."""
+        usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
+
+        assert CurrencyRepository.get_by_codes(["usd", "XXX"]) == {"USD": usd}
+
     def test_get_all_active(self):
         """Test get_all_active returns all currencies."""
         Currency.objects.create(code="USD", name="US Dollar", symbol="$")
@@ -56,6 +107,24 @@ class TestCurrencyRepository:
 
         assert len(currencies) == 2
 
+    def test_get_all_active_cached(self, django_assert_num_queries):
+        """Test get_all_active reuses the cached code map, ordered by code."""
+        Currency.objects.create(code="USD", name="US Dollar", symbol="$")
+        Currency.objects.create(code="EUR", name="Euro", symbol="€")
+        CurrencyRepository.get_code_map()
+
+        with django_assert_num_queries(0):
+            currencies = CurrencyRepository.get_all_active()
+
+        assert [currency.code for currency in currencies] == ["EUR", "USD"]
+
+    def test_get_all_ids_and_codes(self):
+        """Test get_all_ids_and_codes returns (id, code) pairs."""
+        usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
+        eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
+
+        assert set(CurrencyRepository.get_all_ids_and_codes()) == {(usd.id, "USD"), (eur.id, "EUR")}
+
     def test_create(self):
         """Test create creates a new currency."""
         currency = CurrencyRepository.create("USD", "US Dollar", "$")
@@ -92,21 +161,9 @@ class TestCurrencyRepository:
         assert Currency.objects.count() == 2
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestCurrencyExchangeRateRepository:
-    """Tests for CurrencyExchangeRateRepository."""
-
-    def setup_method(self):
-        """Clean up before each test."""
-        CurrencyExchangeRate.objects.all().delete()
-        Currency.objects.all().delete()
-
-    @pytest.fixture
-    def currencies(self):
-        """Create test currencies."""
-        usd = Currency.objects.create(code="USD", name="US Dollar", symbol="$")
-        eur = Currency.objects.create(code="EUR", name="Euro", symbol="€")
-        return {"USD": usd, "EUR": eur}
+    """Tests for CurrencyExchangeRateRepository; currencies come from the session fixture."""
 
     def test_get_rate_success(self, currencies):
         """Test get_rate returns rate when it exists."""
@@ -115,7 +172,7 @@ class TestCurrencyExchangeRateRepository:
             source_currency=currencies["USD"],
             exchanged_currency=currencies["EUR"],
             valuation_date=test_date,
-            rate_value=Decimal("0.85")
+            rate_value=USD_EUR_RATE
         )
 
         rate = CurrencyExchangeRateRepository.get_rate(
@@ -125,7 +182,25 @@ class TestCurrencyExchangeRateRepository:
         )
 
         assert rate is not None
-        assert rate.rate_value == Decimal("0.85")
+        assert rate.rate_value == USD_EUR_RATE
+
+    def test_get_rate_joins_currencies(self, currencies, django_assert_num_queries):
+        """Test get_rate loads both currencies in the same query."""
+        test_date = date(2024, 5, 21)
+        CurrencyExchangeRate.objects.create(
+            source_currency=currencies["USD"],
+            exchanged_currency=currencies["EUR"],
+            valuation_date=test_date,
+            rate_value=USD_EUR_RATE
+        )
+
+        with django_assert_num_queries(1):
+            rate = CurrencyExchangeRateRepository.get_rate(
+                currencies["USD"],
+                currencies["EUR"],
+                test_date
+            )
+            assert (rate.source_currency.code, rate.exchanged_currency.code) == ("USD", "EUR")
 
     def test_get_rate_not_found(self, currencies):
         """Test get_rate returns None when rate doesn't exist."""
@@ -139,40 +214,73 @@ class TestCurrencyExchangeRateRepository:
 
         assert rate is None
 
-    def test_get_rates_for_date_range(self, currencies):
-        """Test get_rates_for_date_range returns rates within range."""
+    def test_get_rates_for_date_range(self, currencies, django_assert_num_queries):
+        """Test get_rates_for_date_range returns rates within range, currencies joined in one query."""
         date1 = date(2024, 5, 21)
         date2 = date(2024, 5, 22)
         date3 = date(2024, 5, 23)
 
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date1,
-            rate_value=Decimal("0.85")
-        )
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date2,
-            rate_value=Decimal("0.86")
-        )
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date3,
-            rate_value=Decimal("0.87")
-        )
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=date1,
+                rate_value=USD_EUR_RATE
+            ),
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=date2,
+                rate_value=NEXT_DAY_RATE
+            ),
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=date3,
+                rate_value=Decimal("0.87")
+            )
+        ])
+
+        with django_assert_num_queries(1):
+            rates = CurrencyExchangeRateRepository.get_rates_for_date_range(
+                currencies["USD"],
+                date1,
+                date2
+            )
+            pairs = [(rate.source_currency.code, rate.exchanged_currency.code) for rate in rates]
+
+        assert pairs == [("USD", "EUR"), ("USD", "EUR")]
+        assert len(rates) == 2
+        assert rates[0].valuation_date == date1
+        assert rates[1].valuation_date == date2
 
-        rates = CurrencyExchangeRateRepository.get_rates_for_date_range(
+    def test_get_rates_for_date_range_raw(self, currencies):
+        """Test get_rates_for_date_range_raw returns plain rows, optionally filtered by target."""
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies[code],
+                valuation_date=date(2024, 5, day),
+                rate_value=USD_EUR_RATE
+            )
+            for code, day in (("EUR", 21), ("GBP", 21), ("EUR", 25))
+        ])
+
+        rows = CurrencyExchangeRateRepository.get_rates_for_date_range_raw(
             currencies["USD"],
-            date1,
-            date2
+            date(2024, 5, 20),
+            date(2024, 5, 22),
+            exchanged_currencies=[currencies["EUR"]]
         )
 
-        assert len(rates) == 2
-        assert rates[0].valuation_date == date1
-        assert rates[1].valuation_date == date2
+        assert rows == [{
+            "valuation_date": date(2024, 5, 21),
+            "exchanged_currency__code": "EUR",
+            "rate_value": USD_EUR_RATE,
+        }]
+        assert len(CurrencyExchangeRateRepository.get_rates_for_date_range_raw(
+            currencies["USD"], date(2024, 5, 20), date(2024, 5, 22)
+        )) == 2
 
     def test_create(self, currencies):
         """Test create creates a new rate."""
@@ -182,10 +290,10 @@ class TestCurrencyExchangeRateRepository:
             source_currency=currencies["USD"],
             exchanged_currency=currencies["EUR"],
             valuation_date=test_date,
-            rate_value=Decimal("0.85")
+            rate_value=USD_EUR_RATE
         )
 
-        assert rate.rate_value == Decimal("0.85")
+        assert rate.rate_value == USD_EUR_RATE
         assert CurrencyExchangeRate.objects.filter(
             source_currency=currencies["USD"],
             valuation_date=test_date
@@ -198,13 +306,13 @@ class TestCurrencyExchangeRateRepository:
                 "source_currency": currencies["USD"],
                 "exchanged_currency": currencies["EUR"],
                 "valuation_date": date(2024, 5, 21),
-                "rate_value": Decimal("0.85")
+                "rate_value": USD_EUR_RATE
             },
             {
                 "source_currency": currencies["USD"],
                 "exchanged_currency": currencies["EUR"],
                 "valuation_date": date(2024, 5, 22),
-                "rate_value": Decimal("0.86")
+                "rate_value": NEXT_DAY_RATE
             },
         ]
 
@@ -212,53 +320,123 @@ class TestCurrencyExchangeRateRepository:
 
         assert len(created) == 2
 
-    def test_delete_older_than(self, currencies):
-        """Test delete_older_than removes old rates."""
-        old_date = date.today() - timedelta(days=100)
-        recent_date = date.today() - timedelta(days=10)
+    def test_bulk_create_uses_batch_size(self, currencies, django_assert_max_num_queries):
+        """Test bulk_create splits inserts into BULK_CREATE_BATCH_SIZE rows."""
+        rates_data = [
+            {
+                "source_currency": currencies["USD"],
+                "exchanged_currency": currencies["EUR"],
+                "valuation_date": date(2024, 5, day),
+                "rate_value": USD_EUR_RATE
+            }
+            for day in (21, 22, 23)
+        ]
 
+        with patch("apps.exchange.infrastructure.persistence.repositories.BULK_CREATE_BATCH_SIZE", 2), \
+                django_assert_max_num_queries(4) as captured:
+            CurrencyExchangeRateRepository.bulk_create(rates_data)
+
+        inserts = [query for query in captured.captured_queries if query["sql"].startswith("INSERT")]
+        assert len(inserts) == 2
+        assert CurrencyExchangeRate.objects.count() == 3
+
+    def test_bulk_insert_rows_skips_existing(self, currencies):
+        """Test bulk_insert_rows inserts id-keyed rows and ignores existing ones."""
         CurrencyExchangeRate.objects.create(
             source_currency=currencies["USD"],
             exchanged_currency=currencies["EUR"],
-            valuation_date=old_date,
-            rate_value=Decimal("0.85")
-        )
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=recent_date,
-            rate_value=Decimal("0.86")
+            valuation_date=date(2024, 5, 21),
+            rate_value=USD_EUR_RATE
         )
+        rows = [
+            {
+                "source_currency_id": currencies["USD"].id,
+                "exchanged_currency_id": currencies["EUR"].id,
+                "valuation_date": date(2024, 5, day),
+                "rate_value": UPDATED_RATE
+            }
+            for day in (21, 22)
+        ]
+
+        inserted = CurrencyExchangeRateRepository.bulk_insert_rows(rows)
+
+        assert inserted == 1
+        assert CurrencyExchangeRate.objects.count() == 2
+        assert CurrencyExchangeRate.objects.get(valuation_date=date(2024, 5, 21)).rate_value == USD_EUR_RATE
+        assert CurrencyExchangeRateRepository.bulk_insert_rows([]) == 0
+
+    def test_delete_older_than(self, currencies, frozen_now):
+        """Test delete_older_than removes old rates."""
+        old_date = date(2024, 2, 11)  # 100 days before FROZEN_NOW
+        recent_date = date(2024, 5, 11)
+
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=old_date,
+                rate_value=USD_EUR_RATE
+            ),
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=recent_date,
+                rate_value=NEXT_DAY_RATE
+            )
+        ])
 
         deleted_count = CurrencyExchangeRateRepository.delete_older_than(days=90)
 
         assert deleted_count == 1
-        assert CurrencyExchangeRate.objects.count() == 1
+        assert not CurrencyExchangeRate.objects.filter(valuation_date=old_date).exists()
+        assert CurrencyExchangeRate.objects.filter(valuation_date=recent_date).exists()
+
+    def test_delete_older_than_single_query(self, currencies, frozen_now, django_assert_max_num_queries):
+        """Test delete_older_than issues one ranged DELETE without loading rows."""
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=valuation_date,
+                rate_value=USD_EUR_RATE
+            )
+            for valuation_date in (date(2024, 2, 11), date(2024, 2, 10), date(2024, 2, 9))
+        ])
+
+        with django_assert_max_num_queries(3) as captured:
+            deleted_count = CurrencyExchangeRateRepository.delete_older_than(days=90)
+
+        statements = [query["sql"].split()[0] for query in captured.captured_queries]
+        assert statements.count("DELETE") == 1
+        assert "SELECT" not in statements
+        assert deleted_count == 3
 
     def test_get_latest_rate_date(self, currencies):
         """Test get_latest_rate_date returns most recent date."""
         date1 = date(2024, 5, 21)
         date2 = date(2024, 5, 25)
 
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date1,
-            rate_value=Decimal("0.85")
-        )
-        CurrencyExchangeRate.objects.create(
-            source_currency=currencies["USD"],
-            exchanged_currency=currencies["EUR"],
-            valuation_date=date2,
-            rate_value=Decimal("0.86")
-        )
+        CurrencyExchangeRate.objects.bulk_create([
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=date1,
+                rate_value=USD_EUR_RATE
+            ),
+            CurrencyExchangeRate(
+                source_currency=currencies["USD"],
+                exchanged_currency=currencies["EUR"],
+                valuation_date=date2,
+                rate_value=NEXT_DAY_RATE
+            )
+        ])
 
         latest_date = CurrencyExchangeRateRepository.get_latest_rate_date(currencies["USD"])
 
         assert latest_date == date2
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestProviderRepository:
     """Tests for ProviderRepository."""
 
@@ -266,12 +444,13 @@ class TestProviderRepository:
         """Clean up before each test."""
         Provider.objects.all().delete()
 
-    def test_get_active_ordered(self):
-        """Test get_active_ordered returns active providers in priority order."""
+    def test_get_active_ordered(self, django_assert_num_queries):
+        """Test get_active_ordered returns active providers in priority order with one query."""
         Provider.objects.create(name=ProviderName.CURRENCY_BEACON, priority=2, is_active=True)
         Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
 
-        providers = ProviderRepository.get_active_ordered()
+        with django_assert_num_queries(1):
+            providers = ProviderRepository.get_active_ordered()
 
         assert len(providers) == 2
         assert providers[0].priority == 1
@@ -287,6 +466,26 @@ class TestProviderRepository:
         assert len(providers) == 1
         assert providers[0].name == ProviderName.MOCK
 
+    def test_get_active_names_cached(self, django_assert_num_queries):
+        """Test get_active_names is served from cache after the first call."""
+        Provider.objects.create(name=ProviderName.CURRENCY_BEACON, priority=2, is_active=True)
+        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
+
+        assert ProviderRepository.get_active_names() == [ProviderName.MOCK, ProviderName.CURRENCY_BEACON]
+
+        with django_assert_num_queries(0):
+            assert ProviderRepository.get_active_names() == [ProviderName.MOCK, ProviderName.CURRENCY_BEACON]
+
+    def test_get_active_names_cache_invalidated_on_save(self):
+        """Test provider changes are visible through get_active_names."""
+        provider = Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
+        assert ProviderRepository.get_active_names() == [ProviderName.MOCK]
+
+        provider.is_active = False
+        provider.save()
+
+        assert ProviderRepository.get_active_names() == []
+
     def test_get_by_name_success(self):
         """Test get_by_name returns provider when it exists."""
         Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
@@ -309,7 +508,7 @@ class TestProviderRepository:
         updated = ProviderRepository.update_priority(provider, 5)
 
         assert updated.priority == 5
-        provider.refresh_from_db()
+        provider.refresh_from_db(fields=["priority"])
         assert provider.priority == 5
 
     def test_toggle_active(self):
@@ -319,7 +518,7 @@ class TestProviderRepository:
         updated = ProviderRepository.toggle_active(provider)
 
         assert updated.is_active is False
-        provider.refresh_from_db()
+        provider.refresh_from_db(fields=["is_active"])
         assert provider.is_active is False
 
     def test_get_all(self):
@@ -1,24 +1,35 @@
+import asyncio
+import json
+
+import aiohttp
 import pytest
-from unittest.mock import Mock, patch
+import requests
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from decimal import Decimal
 from datetime import date
 from apps.exchange.infrastructure.providers.currency_beacon import CurrencyBeaconProvider
 
-@pytest.fixture
-def provider():
+@pytest.fixture(scope="module")
+def beacon_provider():
     return CurrencyBeaconProvider()
 
+@pytest.fixture
+def provider(beacon_provider):
+    """The module's shared provider, without any aiohttp session a test swapped in."""
+    yield beacon_provider
+    beacon_provider._session = None
+
 @pytest.fixture
 def mock_requests_get(mocker):
-    return mocker.patch("requests.get")
+    return mocker.patch("requests.Session.get")
 
 def test_get_exchange_rate_data_success(provider, mock_requests_get):
     """
     Test that get_exchange_rate_data returns the correct Decimal value
     when the API call is successful using /historical endpoint.
     """
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = Mock(status_code=200)
+    mock_response.content = json.dumps({
         "meta": {"code": 200, "disclaimer": "Usage subject to terms: https://currencybeacon.com/terms"},
         "response": {
             "date": "2024-05-21",
@@ -27,8 +38,7 @@ def test_get_exchange_rate_data_success(provider, mock_requests_get):
                 "GBP": 0.7854
             }
         }
-    }
-    mock_response.raise_for_status.return_value = None
+    }).encode()
     mock_requests_get.return_value = mock_response
 
     rate = provider.get_exchange_rate_data("USD", "GBP", date(2024, 5, 21))
@@ -55,19 +65,198 @@ def test_get_exchange_rate_data_api_error(provider, mock_requests_get):
     assert rate is None
     mock_requests_get.assert_called_once()
 
+def test_get_exchange_rate_data_http_error(provider, mock_requests_get):
+    """
+    Test that an error status is still raised and turned into a missing rate.
+    """
+    mock_response = Mock(status_code=503)
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("503 Server Error")
+    mock_requests_get.return_value = mock_response
+
+    rate = provider.get_exchange_rate_data("USD", "GBP", date(2024, 5, 21))
+
+    assert rate is None
+    mock_response.raise_for_status.assert_called_once()
+
 def test_get_exchange_rate_data_missing_key(provider, mock_requests_get):
     """
     Test that get_exchange_rate_data handles missing keys in response gracefully
     by raising/catching exception (KeyError would be caught by general Exception).
     """
-    mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response = Mock(status_code=200)
+    mock_response.content = json.dumps({
         "meta": {"code": 200},
         "response": {"rates": {}} # Missing the currency rate
-    }
-    mock_response.raise_for_status.return_value = None
+    }).encode()
     mock_requests_get.return_value = mock_response
 
     rate = provider.get_exchange_rate_data("USD", "GBP", date(2024, 5, 21))
 
     assert rate is None
+
+def test_get_exchange_rates_bulk_single_request(provider, mock_requests_get):
+    """
+    Test that get_exchange_rates_bulk fetches every target with one request
+    and leaves out targets missing from the response.
+    """
+    mock_response = Mock(status_code=200)
+    mock_response.content = json.dumps({
+        "response": {"rates": {"EUR": 0.92, "GBP": 0.7854}}
+    }).encode()
+    mock_requests_get.return_value = mock_response
+
+    rates = provider.get_exchange_rates_bulk("USD", ["EUR", "GBP", "CHF"], date(2024, 5, 21))
+
+    assert rates == {"EUR": Decimal("0.92"), "GBP": Decimal("0.7854")}
+    mock_requests_get.assert_called_once()
+    assert "symbols=EUR,GBP,CHF" in mock_requests_get.call_args[0][0]
+
+def test_get_exchange_rates_bulk_served_from_cache(provider, mock_requests_get):
+    """
+    Test that cached rates are not requested again and only the missing
+    targets are sent to the API.
+    """
+    first, second = Mock(status_code=200), Mock(status_code=200)
+    first.content = json.dumps({"response": {"rates": {"EUR": 0.92}}}).encode()
+    second.content = json.dumps({"response": {"rates": {"GBP": 0.7854}}}).encode()
+    mock_requests_get.side_effect = [first, second]
+
+    provider.get_exchange_rates_bulk("USD", ["EUR"], date(2024, 5, 21))
+    rates = provider.get_exchange_rates_bulk("USD", ["EUR", "GBP"], date(2024, 5, 21))
+
+    assert rates == {"EUR": Decimal("0.92"), "GBP": Decimal("0.7854")}
+    assert mock_requests_get.call_count == 2
+    assert mock_requests_get.call_args[0][0].endswith("symbols=GBP")
+
+    assert provider.get_exchange_rate_data("USD", "GBP", date(2024, 5, 21)) == Decimal("0.7854")
+    assert mock_requests_get.call_count == 2
+
+def test_rate_cache_timeout_is_bounded(provider):
+    """
+    Test that cached rates always expire: past dates after PAST_RATE_TIMEOUT,
+    today's after TODAY_RATE_TIMEOUT.
+    """
+    assert provider._rate_cache_timeout(date(2024, 5, 21)) == provider.PAST_RATE_TIMEOUT
+    assert provider._rate_cache_timeout(date.today()) == provider.TODAY_RATE_TIMEOUT
+
+def test_get_exchange_rate_data_failure_not_cached(provider, mock_requests_get):
+    """
+    Test that a failed request is not cached, so the next lookup retries it.
+    """
+    mock_response = Mock(status_code=200)
+    mock_response.content = json.dumps({"response": {"rates": {"GBP": 0.7854}}}).encode()
+    mock_requests_get.side_effect = [Exception("API Error"), mock_response]
+
+    assert provider.get_exchange_rate_data("USD", "GBP", date(2024, 5, 21)) is None
+    assert provider.get_exchange_rate_data("USD", "GBP", date(2024, 5, 21)) == Decimal("0.7854")
+    assert mock_requests_get.call_count == 2
+
+def test_get_exchange_rates_timeseries_single_request(provider, mock_requests_get):
+    """
+    Test that get_exchange_rates_timeseries fetches every target over the
+    whole range with one /timeseries request.
+    """
+    mock_response = Mock(status_code=200)
+    mock_response.content = json.dumps({
+        "response": {
+            "2024-05-21": {"EUR": 0.92, "GBP": 0.7854},
+            "2024-05-22": {"EUR": 0.93, "GBP": 0.7861},
+        }
+    }).encode()
+    mock_requests_get.return_value = mock_response
+
+    series = provider.get_exchange_rates_timeseries("USD", ["EUR", "GBP"], date(2024, 5, 21), date(2024, 5, 22))
+
+    assert series == {
+        date(2024, 5, 21): {"EUR": Decimal("0.92"), "GBP": Decimal("0.7854")},
+        date(2024, 5, 22): {"EUR": Decimal("0.93"), "GBP": Decimal("0.7861")},
+    }
+    mock_requests_get.assert_called_once()
+    url = mock_requests_get.call_args[0][0]
+    assert "/timeseries" in url
+    assert "start_date=2024-05-21" in url
+    assert "end_date=2024-05-22" in url
+    assert "symbols=EUR,GBP" in url
+
+    # The fetched points are cached for the single-date lookups too
+    assert provider.get_exchange_rate_data("USD", "GBP", date(2024, 5, 22)) == Decimal("0.7861")
+    assert provider.get_exchange_rates_timeseries("USD", ["EUR"], date(2024, 5, 21), date(2024, 5, 22)) == {
+        date(2024, 5, 21): {"EUR": Decimal("0.92")},
+        date(2024, 5, 22): {"EUR": Decimal("0.93")},
+    }
+    mock_requests_get.assert_called_once()
+
+def test_get_exchange_rate_data_async_success(provider):
+    """
+    Test that get_exchange_rate_data_async parses the rate using the shared session.
+    """
+    mock_response = MagicMock()
+    mock_response.raise_for_status.return_value = None
+    mock_response.read = AsyncMock(return_value=b'{"response": {"rates": {"GBP": 0.7854}}}')
+    mock_session = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    provider._session = mock_session
+
+    rate = asyncio.run(provider.get_exchange_rate_data_async("USD", "GBP", date(2024, 5, 21)))
+
+    assert rate == Decimal("0.7854")
+    url = mock_session.get.call_args[0][0]
+    assert "/historical" in url
+    assert "date=2024-05-21" in url
+
+@patch("asyncio.sleep", new_callable=AsyncMock)
+def test_get_exchange_rate_data_async_client_error(mock_sleep, provider):
+    """
+    Test that get_exchange_rate_data_async retries connection errors, then returns None.
+    """
+    mock_session = MagicMock()
+    mock_session.get.side_effect = aiohttp.ClientConnectionError("Connection refused")
+    provider._session = mock_session
+
+    rate = asyncio.run(provider.get_exchange_rate_data_async("USD", "GBP", date(2024, 5, 21)))
+
+    assert rate is None
+    assert mock_session.get.call_count == provider.MAX_ATTEMPTS
+    assert mock_sleep.await_count == provider.MAX_ATTEMPTS - 1
+
+def _http_error_response(status):
+    response = MagicMock()
+    response.status = status
+    response.headers = {"Retry-After": "2"}
+    response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+        request_info=Mock(), history=(), status=status
+    )
+    return response
+
+@patch("asyncio.sleep", new_callable=AsyncMock)
+def test_get_exchange_rate_data_async_retries_rate_limit(mock_sleep, provider):
+    """
+    Test that a 429 is retried after the Retry-After delay.
+    """
+    ok_response = MagicMock()
+    ok_response.status = 200
+    ok_response.raise_for_status.return_value = None
+    ok_response.read = AsyncMock(return_value=b'{"response": {"rates": {"GBP": 0.7854}}}')
+    mock_session = MagicMock()
+    mock_session.get.return_value.__aenter__.side_effect = [_http_error_response(429), ok_response]
+    provider._session = mock_session
+
+    rate = asyncio.run(provider.get_exchange_rate_data_async("USD", "GBP", date(2024, 5, 21)))
+
+    assert rate == Decimal("0.7854")
+    mock_sleep.assert_awaited_once_with(2.0)
+
+@patch("asyncio.sleep", new_callable=AsyncMock)
+def test_get_exchange_rate_data_async_permanent_error_not_retried(mock_sleep, provider):
+    """
+    Test that a 404 fails immediately without retrying.
+    """
+    mock_session = MagicMock()
+    mock_session.get.return_value.__aenter__.return_value = _http_error_response(404)
+    provider._session = mock_session
+
+    rate = asyncio.run(provider.get_exchange_rate_data_async("USD", "GBP", date(2024, 5, 21)))
+
+    assert rate is None
+    assert mock_session.get.call_count == 1
+    mock_sleep.assert_not_awaited()
@@ -0,0 +1,63 @@
+from decimal import Decimal
+
+import pytest
+import requests
+
+from apps.exchange.infrastructure.providers.http import (
+    RETRY_BACKOFF_MAX,
+    RETRY_STATUSES,
+    RETRY_TOTAL,
+    build_requests_session,
+    loads_json,
+    raise_for_error_status,
+)
+
+
+def test_build_requests_session_mounts_retrying_pool():
+    """
+    Test that build_requests_session mounts a pooled adapter with retries on transient statuses.
+    """
+    session = build_requests_session()
+
+    adapter = session.get_adapter("https://api.currencybeacon.com/v1/historical")
+    assert adapter._pool_maxsize == 20
+    assert adapter.max_retries.total == RETRY_TOTAL
+    assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUSES)
+    assert adapter.max_retries.raise_on_status is False
+
+
+def test_build_requests_session_bounds_retry_waits():
+    """
+    Test that retries ignore Retry-After and cap the backoff, so a rate-limited
+    provider cannot hold a web request for long.
+    """
+    retry = build_requests_session().get_adapter("https://api.currencybeacon.com").max_retries
+
+    assert retry.respect_retry_after_header is False
+    assert retry.backoff_max == RETRY_BACKOFF_MAX
+
+
+def test_loads_json_parses_floats_as_decimal():
+    """
+    Test that loads_json reads floats exactly as Decimal, without a float round trip.
+    """
+    data = loads_json(b'{"rates": {"EUR": 0.123456789012345678, "JPY": 150}}')
+
+    assert data["rates"]["EUR"] == Decimal("0.123456789012345678")
+    assert data["rates"]["JPY"] == 150
+
+
+@pytest.mark.parametrize("status_code, raises", [(200, False), (399, False), (404, True), (503, True)])
+def test_raise_for_error_status(status_code, raises):
+    """
+    Test that raise_for_error_status raises HTTPError for 4xx/5xx responses only.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = "https://api.currencybeacon.com/v1/latest"
+
+    if raises:
+        with pytest.raises(requests.HTTPError):
+            raise_for_error_status(response)
+    else:
+        raise_for_error_status(response)
@@ -1,6 +1,6 @@
 import pytest
 from decimal import Decimal
-from datetime import date
+from datetime import date, timedelta
 from apps.exchange.infrastructure.providers.mock import MockProvider
 
 
@@ -53,6 +53,13 @@ def test_get_exchange_rate_data_different_dates(provider):
     assert rate1 != rate2
 
 
+def test_get_exchange_rate_data_same_currency(provider):
+    """
+    Test that an identity pair returns exactly 1, without variation.
+    """
+    assert provider.get_exchange_rate_data("EUR", "EUR", date(2024, 5, 21)) == Decimal("1")
+
+
 def test_get_exchange_rate_data_unsupported_currency(provider):
     """
     Test that unsupported currency returns None.
@@ -85,3 +92,18 @@ def test_get_exchange_rate_data_precision(provider):
     if "." in rate_str:
         decimal_places = len(rate_str.split(".")[1])
         assert decimal_places <= 6
+
+
+def test_get_exchange_rates_timeseries_matches_single_lookups(provider):
+    """
+    Test that a generated series gives the same rates as day-by-day lookups,
+    and leaves unsupported targets out.
+    """
+    series = provider.get_exchange_rates_timeseries("USD", ["EUR", "GBP", "USD", "XXX"], date(2024, 5, 21), date(2024, 5, 25))
+
+    assert list(series) == [date(2024, 5, 21) + timedelta(days=offset) for offset in range(5)]
+    for day, rates in series.items():
+        assert rates == {
+            code: provider.get_exchange_rate_data("USD", code, day)
+            for code in ("EUR", "GBP", "USD")
+        }
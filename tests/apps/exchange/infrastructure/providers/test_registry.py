@@ -9,13 +9,20 @@ from apps.exchange.infrastructure.providers.mock import MockProvider
 from apps.exchange.infrastructure.providers.currency_beacon import CurrencyBeaconProvider
 
 
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 class TestProviderRegistry:
     """Tests for provider registry functions."""
 
     def setup_method(self):
-        """Clean up providers before each test."""
-        Provider.objects.all().delete()
+        """
+        Clean up providers before each test.
+
+        The seeded and session providers are removed inside the test's
+        transaction, so the rollback restores them. A raw DELETE skips the
+        row fetch that delete() does to send post_delete, and the cache those
+        signals would invalidate is cleared by conftest anyway.
+        """
+        Provider.objects.all()._raw_delete(Provider.objects.db)
 
     def test_provider_registry_contains_providers(self):
         """
@@ -33,6 +40,12 @@ class TestProviderRegistry:
         assert instance is not None
         assert isinstance(instance, MockProvider)
 
+    def test_get_provider_instance_is_memoized(self):
+        """
+        Test that get_provider_instance returns the same instance on every call.
+        """
+        assert get_provider_instance(ProviderName.MOCK) is get_provider_instance(ProviderName.MOCK)
+
     def test_get_provider_instance_currency_beacon(self):
         """
         Test that get_provider_instance returns CurrencyBeaconProvider instance.
@@ -56,7 +69,7 @@ class TestProviderRegistry:
         """
         providers = get_active_providers_ordered()
 
-        assert providers == []
+        assert providers == ()
 
     def test_get_active_providers_ordered_single(self):
         """
@@ -77,16 +90,10 @@ class TestProviderRegistry:
         """
         Test get_active_providers_ordered returns providers in priority order.
         """
-        Provider.objects.create(
-            name=ProviderName.CURRENCY_BEACON,
-            priority=2,
-            is_active=True
-        )
-        Provider.objects.create(
-            name=ProviderName.MOCK,
-            priority=1,
-            is_active=True
-        )
+        Provider.objects.bulk_create([
+            Provider(name=ProviderName.CURRENCY_BEACON, priority=2, is_active=True),
+            Provider(name=ProviderName.MOCK, priority=1, is_active=True),
+        ])
 
         providers = get_active_providers_ordered()
 
@@ -100,16 +107,10 @@ class TestProviderRegistry:
         """
         Test that get_active_providers_ordered only returns active providers.
         """
-        Provider.objects.create(
-            name=ProviderName.MOCK,
-            priority=1,
-            is_active=True
-        )
-        Provider.objects.create(
-            name=ProviderName.CURRENCY_BEACON,
-            priority=2,
-            is_active=False  # Inactive
-        )
+        Provider.objects.bulk_create([
+            Provider(name=ProviderName.MOCK, priority=1, is_active=True),
+            Provider(name=ProviderName.CURRENCY_BEACON, priority=2, is_active=False),  # Inactive
+        ])
 
         providers = get_active_providers_ordered()
 
@@ -132,3 +133,19 @@ class TestProviderRegistry:
 
         assert len(providers) == 1
         assert all(provider is not None for provider in providers)
+
+    def test_get_active_providers_ordered_reuses_tuple(self):
+        """
+        Test that the ordered providers are reused until the active set changes.
+        """
+        Provider.objects.create(name=ProviderName.MOCK, priority=1, is_active=True)
+
+        first = get_active_providers_ordered()
+        assert get_active_providers_ordered() is first
+
+        Provider.objects.create(name=ProviderName.CURRENCY_BEACON, priority=2, is_active=True)
+        second = get_active_providers_ordered()
+
+        assert second is not first
+        assert len(second) == 2
+        assert second[0] is first[0]
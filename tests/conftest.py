@@ -0,0 +1,69 @@
+import pytest
+from django.core.cache import cache
+
+from apps.exchange.infrastructure.persistence.models import Currency, Provider, ProviderName
+
+
+# Reference currencies shared by the API tests: (code, name, symbol)
+REFERENCE_CURRENCIES = (
+    ("USD", "US Dollar", "$"),
+    ("EUR", "Euro", "€"),
+    ("GBP", "British Pound", "£"),
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached lookups never leak between tests."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture(scope="session")
+def currency_ids(django_db_setup, django_db_blocker):
+    """
+    Create the reference currencies once per session and return their ids by code.
+
+    Tests run in rolled-back transactions leave these rows untouched. Ids are
+    returned rather than instances, which would go stale across tests.
+    """
+    with django_db_blocker.unblock():
+        # Migration 0002 may already have seeded some of them
+        Currency.objects.bulk_create(
+            [Currency(code=code, name=name, symbol=symbol) for code, name, symbol in REFERENCE_CURRENCIES],
+            ignore_conflicts=True
+        )
+        return {
+            code: currency.pk
+            for code, currency in Currency.objects.in_bulk(
+                [code for code, _, _ in REFERENCE_CURRENCIES], field_name="code"
+            ).items()
+        }
+
+
+@pytest.fixture
+def currencies(db, currency_ids):
+    """Reference currencies keyed by code, fetched for the current test."""
+    return {
+        currency.code: currency
+        for currency in Currency.objects.filter(pk__in=currency_ids.values())
+    }
+
+
+@pytest.fixture(scope="session")
+def mock_provider_id(django_db_setup, django_db_blocker):
+    """Create the active mock provider once per session and return its id."""
+    with django_db_blocker.unblock():
+        # Migration 0002 may already have seeded it, at another priority
+        provider, _ = Provider.objects.get_or_create(
+            name=ProviderName.MOCK,
+            defaults={"priority": 1, "is_active": True}
+        )
+        return provider.pk
+
+
+@pytest.fixture
+def mock_provider_active(db, mock_provider_id):
+    """Active mock provider in DB, fetched for the current test."""
+    return Provider.objects.get(pk=mock_provider_id)